@@ -3,16 +3,19 @@ Board Widget - Qt5 widget for displaying and interacting with the game board.
 Modern, clean, light design.
 """
 
-from typing import Optional, Callable, List
-from PyQt5.QtWidgets import QWidget, QGridLayout, QPushButton, QSizePolicy
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont
+from typing import Optional, Callable, Dict, List
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, pyqtSignal, QRectF, QSize, QTimer
+from PyQt5.QtGui import QFont, QPainter, QColor, QPen
 
 
 class BoardWidget(QWidget):
     """
     Widget for displaying the Tic-Tac-Toe board.
     
+    The whole board is drawn by a single paintEvent; cells are plain
+    entries in a flat model rather than child widgets.
+    
     Signals:
         cell_clicked: Emitted when a cell is clicked (row, col)
     """
@@ -27,7 +30,14 @@ class BoardWidget(QWidget):
     COLOR_CELL_BG = "#FFFFFF"
     COLOR_CELL_BORDER = "#E0E0E0"
     COLOR_TEXT = "#234C6A"
-   
+    
+    # Cell size bounds and grid spacing, in pixels
+    CELL_MIN_SIZE = 100
+    CELL_MAX_SIZE = 140
+    CELL_SPACING = 5
+    BOARD_MARGIN = 20
+    BOARD_RADIUS = 20
+    CELL_RADIUS = 16
     
     def __init__(self, size: int = 3, parent=None):
         """
@@ -39,79 +49,245 @@ class BoardWidget(QWidget):
         """
         super().__init__(parent)
         self.size = size
-        self.cells: List[List[QPushButton]] = []
+        self._size_sq = size * size
+        # Cell state stored flat as one byte per cell, indexed as
+        # row * size + col; 0 is empty, other values are symbol codes
+        self._state = bytearray(self._size_sq)
+        self._code_to_symbol: List[Optional[str]] = [None]
+        self._symbol_to_code: Dict[str, int] = {}
+        self._winning_cells: set = set()
+        self._hover_idx: Optional[int] = None
+        self._pressed_idx: Optional[int] = None
         self.enabled = False
         
+        # Shared fonts for cell symbols, built once per widget
+        self._cell_font = QFont(self.font())
+        self._cell_font.setPointSize(36)
+        self._cell_font.setWeight(QFont.DemiBold)
+        self._win_font = QFont(self.font())
+        self._win_font.setPointSize(40)
+        self._win_font.setWeight(QFont.Bold)
+        
         self._init_ui()
     
     def _init_ui(self):
         """Initialize the user interface."""
-        layout = QGridLayout()
-        layout.setSpacing(5)
-        layout.setContentsMargins(20, 20, 20, 20)
-        self.setLayout(layout)
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._update_size_bounds()
+    
+    def _board_extent(self, cell_size: int) -> int:
+        """
+        Get the board width/height for a given cell size.
+        
+        Args:
+            cell_size: Cell side length in pixels
+        
+        Returns:
+            Board side length in pixels
+        """
+        return (self.size * cell_size
+                + (self.size - 1) * self.CELL_SPACING
+                + 2 * self.BOARD_MARGIN)
+    
+    def _update_size_bounds(self):
+        """Recompute size limits after the board size changes."""
+        max_extent = self._board_extent(self.CELL_MAX_SIZE)
+        self.setMaximumSize(max_extent, max_extent)
+        self.updateGeometry()
+    
+    def sizeHint(self) -> QSize:
+        """Preferred size: every cell at its minimum size."""
+        extent = self._board_extent(self.CELL_MIN_SIZE)
+        return QSize(extent, extent)
+    
+    def minimumSizeHint(self) -> QSize:
+        """Minimum size: every cell at its minimum size."""
+        return self.sizeHint()
+    
+    def _cell_geometry(self):
+        """
+        Compute where the grid is drawn within the widget.
+        
+        Returns:
+            Tuple of (left, top, cell_size) in pixels
+        """
+        inner = min(self.width(), self.height()) - 2 * self.BOARD_MARGIN
+        cell_size = (inner - (self.size - 1) * self.CELL_SPACING) / self.size
+        cell_size = max(1.0, min(float(self.CELL_MAX_SIZE), cell_size))
+        extent = self.size * cell_size + (self.size - 1) * self.CELL_SPACING
+        left = (self.width() - extent) / 2
+        top = (self.height() - extent) / 2
+        return left, top, cell_size
+    
+    def _cell_rect(self, idx: int) -> QRectF:
+        """
+        Get the rectangle of a cell.
+        
+        Args:
+            idx: Flat cell index
+        
+        Returns:
+            Cell rectangle in widget coordinates
+        """
+        left, top, cell_size = self._cell_geometry()
+        row, col = divmod(idx, self.size)
+        step = cell_size + self.CELL_SPACING
+        return QRectF(left + col * step, top + row * step, cell_size, cell_size)
+    
+    def _cell_at(self, pos) -> Optional[int]:
+        """
+        Find the cell under a point.
+        
+        Args:
+            pos: Point in widget coordinates
+        
+        Returns:
+            Flat cell index, or None if the point is not on a cell
+        """
+        left, top, cell_size = self._cell_geometry()
+        step = cell_size + self.CELL_SPACING
+        x = pos.x() - left
+        y = pos.y() - top
+        if x < 0 or y < 0:
+            return None
+        col, x_off = divmod(x, step)
+        row, y_off = divmod(y, step)
+        col, row = int(col), int(row)
+        if row >= self.size or col >= self.size or x_off > cell_size or y_off > cell_size:
+            return None
+        return row * self.size + col
+    
+    def _is_clickable(self, idx: Optional[int]) -> bool:
+        """Check whether a cell currently accepts clicks."""
+        return idx is not None and self.enabled and not self._state[idx]
+    
+    def _symbol_code(self, symbol: Optional[str]) -> int:
+        """
+        Get the byte code for a symbol, assigning a new one if needed.
+        
+        Args:
+            symbol: Symbol, or None for an empty cell
+        
+        Returns:
+            Symbol code (0 for empty)
+        """
+        if not symbol:
+            return 0
+        code = self._symbol_to_code.get(symbol)
+        if code is None:
+            code = len(self._code_to_symbol)
+            self._code_to_symbol.append(symbol)
+            self._symbol_to_code[symbol] = code
+        return code
+    
+    def _update_cell(self, idx: int):
+        """Schedule a repaint of a single cell."""
+        self.update(self._cell_rect(idx).toAlignedRect().adjusted(-3, -3, 3, 3))
+    
+    def paintEvent(self, event):
+        """Draw the board background and every cell."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
         
         # Clean background
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.COLOR_BG};
-                border-radius: 20px;
-            }}
-        """)
-        
-        # Create grid of buttons
-        for row in range(self.size):
-            row_cells = []
-            for col in range(self.size):
-                cell = QPushButton()
-                cell.setMinimumSize(100, 100)
-                cell.setMaximumSize(140, 140)
-                cell.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-                
-                # Beautiful modern styling
-                cell.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {self.COLOR_CELL_BG};
-                        border: 2px solid {self.COLOR_CELL_BORDER};
-                        border-radius: 16px;
-                        font-size: 36pt;
-                        font-weight: 600;
-                        color: {self.COLOR_PRIMARY};
-                    }}
-                    QPushButton:hover:enabled {{
-                        background-color: {self.COLOR_SECONDARY};
-                        border: 2px solid {self.COLOR_PRIMARY};
-                    }}
-                    QPushButton:pressed:enabled {{
-                        background-color: {self.COLOR_PRIMARY};
-                        color: white;
-                    }}
-                    QPushButton:disabled {{
-                        background-color: {self.COLOR_CELL_BG};
-                        color: {self.COLOR_TEXT};
-                        border: 2px solid {self.COLOR_CELL_BORDER};
-                    }}
-                """)
-                
-                # Connect click handler
-                cell.clicked.connect(lambda checked, r=row, c=col: self._on_cell_clicked(r, c))
-                
-                layout.addWidget(cell, row, col)
-                row_cells.append(cell)
-                cell.setEnabled(False)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.COLOR_BG))
+        painter.drawRoundedRect(QRectF(self.rect()), self.BOARD_RADIUS, self.BOARD_RADIUS)
+        
+        cell_font = self._cell_font
+        win_font = self._win_font
+        
+        left, top, cell_size = self._cell_geometry()
+        step = cell_size + self.CELL_SPACING
+        dirty = event.rect()
+        
+        code_to_symbol = self._code_to_symbol
+        
+        for idx, code in enumerate(self._state):
+            row, col = divmod(idx, self.size)
+            rect = QRectF(left + col * step, top + row * step, cell_size, cell_size)
+            if not dirty.intersects(rect.toAlignedRect()):
+                continue
+            
+            clickable = self._is_clickable(idx)
+            if idx in self._winning_cells:
+                bg, border, border_width = self.COLOR_SUCCESS, self.COLOR_SUCCESS, 3
+                text_color, font = "white", win_font
+            elif clickable and idx == self._pressed_idx:
+                bg, border, border_width = self.COLOR_PRIMARY, self.COLOR_CELL_BORDER, 2
+                text_color, font = "white", cell_font
+            elif clickable and idx == self._hover_idx:
+                bg, border, border_width = self.COLOR_SECONDARY, self.COLOR_PRIMARY, 2
+                text_color, font = self.COLOR_PRIMARY, cell_font
+            else:
+                bg, border, border_width = self.COLOR_CELL_BG, self.COLOR_CELL_BORDER, 2
+                text_color = self.COLOR_PRIMARY if clickable else self.COLOR_TEXT
+                font = cell_font
             
-            self.cells.append(row_cells)
+            inset = border_width / 2
+            painter.setPen(QPen(QColor(border), border_width))
+            painter.setBrush(QColor(bg))
+            painter.drawRoundedRect(rect.adjusted(inset, inset, -inset, -inset),
+                                    self.CELL_RADIUS, self.CELL_RADIUS)
+            
+            if code:
+                painter.setPen(QColor(text_color))
+                painter.setFont(font)
+                painter.drawText(rect, Qt.AlignCenter, code_to_symbol[code])
+        
+        painter.end()
+    
+    def mouseMoveEvent(self, event):
+        """Track the hovered cell."""
+        idx = self._cell_at(event.pos())
+        if idx != self._hover_idx:
+            old_idx, self._hover_idx = self._hover_idx, idx
+            if old_idx is not None:
+                self._update_cell(old_idx)
+            if idx is not None:
+                self._update_cell(idx)
+        super().mouseMoveEvent(event)
+    
+    def leaveEvent(self, event):
+        """Clear hover state when the mouse leaves the board."""
+        if self._hover_idx is not None:
+            old_idx, self._hover_idx = self._hover_idx, None
+            self._update_cell(old_idx)
+        super().leaveEvent(event)
+    
+    def mousePressEvent(self, event):
+        """Start a click on a cell."""
+        if event.button() == Qt.LeftButton:
+            idx = self._cell_at(event.pos())
+            if self._is_clickable(idx):
+                self._pressed_idx = idx
+                self._update_cell(idx)
+        super().mousePressEvent(event)
+    
+    def mouseReleaseEvent(self, event):
+        """Complete a click if released over the pressed cell."""
+        if event.button() == Qt.LeftButton and self._pressed_idx is not None:
+            idx, self._pressed_idx = self._pressed_idx, None
+            self._update_cell(idx)
+            if self._cell_at(event.pos()) == idx:
+                self._on_cell_clicked(*divmod(idx, self.size))
+        super().mouseReleaseEvent(event)
     
     def _on_cell_clicked(self, row: int, col: int):
         """
         Handle cell click.
         
+        The signal is emitted from the event loop rather than inside the
+        mouse handler, so slow slots don't hold up input processing.
+        
         Args:
             row: Row index
             col: Column index
         """
-        if self.enabled and not self.cells[row][col].text():
-            self.cell_clicked.emit(row, col)
+        if self.enabled and not self._state[row * self.size + col]:
+            QTimer.singleShot(0, lambda: self.cell_clicked.emit(row, col))
     
     def set_cell(self, row: int, col: int, symbol: str):
         """
@@ -123,8 +299,7 @@ class BoardWidget(QWidget):
             symbol: Symbol to display
         """
         if 0 <= row < self.size and 0 <= col < self.size:
-            self.cells[row][col].setText(symbol)
-            self.cells[row][col].setEnabled(False)
+            self._set_cell_unchecked(row * self.size + col, self._symbol_code(symbol))
     
     def clear_cell(self, row: int, col: int):
         """
@@ -135,31 +310,60 @@ class BoardWidget(QWidget):
             col: Column index
         """
         if 0 <= row < self.size and 0 <= col < self.size:
-            self.cells[row][col].setText("")
-            if self.enabled:
-                self.cells[row][col].setEnabled(True)
+            self._set_cell_unchecked(row * self.size + col, 0)
+    
+    def _set_cell_unchecked(self, idx: int, code: int):
+        """
+        Set a cell's symbol code without bounds checks.
+        
+        Args:
+            idx: Flat cell index, assumed valid
+            code: Symbol code (0 for empty)
+        """
+        if self._state[idx] != code:
+            self._state[idx] = code
+            self._update_cell(idx)
     
     def set_board_state(self, grid: List[List[Optional[str]]]):
         """
         Set the entire board state.
         
+        The grid is encoded into a new byte state and compared with the
+        current one in a single bytearray comparison; a repaint is only
+        scheduled if something changed.
+        
         Args:
             grid: 2D list of symbols
         """
-        for row in range(self.size):
-            for col in range(self.size):
-                if row < len(grid) and col < len(grid[row]):
-                    symbol = grid[row][col]
-                    if symbol:
-                        self.set_cell(row, col, symbol)
-                    else:
-                        self.clear_cell(row, col)
+        size = self.size
+        symbol_code = self._symbol_code
+        new_state = bytearray(self._state)
+        for row, grid_row in enumerate(grid[:size]):
+            base = row * size
+            for col, symbol in enumerate(grid_row[:size]):
+                new_state[base + col] = symbol_code(symbol)
+        if new_state == self._state:
+            return
+        self._state = new_state
+        self.update()
+    
+    def apply_cell_changes(self, changes: List[tuple]):
+        """
+        Update only the given cells.
+        
+        Args:
+            changes: List of (row, col, symbol) tuples; symbol None clears
+        """
+        size = self.size
+        for row, col, symbol in changes:
+            if 0 <= row < size and 0 <= col < size:
+                self._set_cell_unchecked(row * size + col, self._symbol_code(symbol))
     
     def clear_board(self):
         """Clear all cells."""
-        for row in range(self.size):
-            for col in range(self.size):
-                self.clear_cell(row, col)
+        self._state = bytearray(self._size_sq)
+        self._winning_cells.clear()
+        self.update()
     
     def set_enabled(self, enabled: bool):
         """
@@ -168,12 +372,11 @@ class BoardWidget(QWidget):
         Args:
             enabled: Whether to enable the board
         """
+        if self.enabled == enabled:
+            return
         self.enabled = enabled
-        for row in range(self.size):
-            for col in range(self.size):
-                # Only enable empty cells
-                if not self.cells[row][col].text():
-                    self.cells[row][col].setEnabled(enabled)
+        self.setCursor(Qt.PointingHandCursor if enabled else Qt.ArrowCursor)
+        self.update()
     
     def highlight_winning_cells(self, cells: List[tuple]):
         """
@@ -182,18 +385,11 @@ class BoardWidget(QWidget):
         Args:
             cells: List of (row, col) tuples
         """
+        size = self.size
         for row, col in cells:
-            if 0 <= row < self.size and 0 <= col < self.size:
-                self.cells[row][col].setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {self.COLOR_SUCCESS};
-                        border: 3px solid {self.COLOR_SUCCESS};
-                        border-radius: 16px;
-                        font-size: 40pt;
-                        font-weight: bold;
-                        color: white;
-                    }}
-                """)
+            if 0 <= row < size and 0 <= col < size:
+                self._winning_cells.add(row * size + col)
+        self.update()
     
     def resize_board(self, new_size: int):
         """
@@ -202,17 +398,11 @@ class BoardWidget(QWidget):
         Args:
             new_size: New board size
         """
-        # Clear existing cells
-        for row in self.cells:
-            for cell in row:
-                cell.deleteLater()
-        self.cells.clear()
-        
-        # Remove old layout
-        old_layout = self.layout()
-        if old_layout:
-            QWidget().setLayout(old_layout)
-        
-        # Update size and recreate UI
         self.size = new_size
-        self._init_ui()
+        self._size_sq = new_size * new_size
+        self._state = bytearray(self._size_sq)
+        self._winning_cells.clear()
+        self._hover_idx = None
+        self._pressed_idx = None
+        self._update_size_bounds()
+        self.update()
@@ -5,13 +5,12 @@ Client main entry point.
 
 import sys
 
-from PyQt5.QtWidgets import QApplication
-from .main_window import MainWindow
-
 
 def main():
     """Main function to run the client application."""
- 
+    # Qt is only imported when the client actually runs
+    from PyQt5.QtWidgets import QApplication
+    from .main_window import MainWindow
     
     # Create Qt application
     app = QApplication(sys.argv)
@@ -3,21 +3,24 @@ Main Window - Main GUI application for the Tic-Tac-Toe client.
 Beautiful modern design with home page navigation.
 """
 
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Optional, Dict, List
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                               QPushButton, QLabel, QLineEdit, QSpinBox, 
-                              QListWidget, QMessageBox, QGroupBox,
+                              QListWidget, QMessageBox,
                               QDialog, QDialogButtonBox, QFormLayout, QStackedWidget,
-                              QListWidgetItem, QFrame, QGridLayout)
-from PyQt5.QtCore import Qt, pyqtSlot, QTimer, QPropertyAnimation, QEasingCurve, QRect
-from PyQt5.QtGui import QFont, QIcon
-from .network_client import NetworkClient
-from .board_widget import BoardWidget
+                              QListWidgetItem, QFrame, QGridLayout, QApplication,
+                              QLayout)
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtGui import QFont, QIcon, QPixmap
 from ..common.protocol import MessageType
 from ..common.game import GameState
+import functools
 import json
 import os
 
+if TYPE_CHECKING:
+    from .board_widget import BoardWidget
+
 
 # Modern color palette
 COLOR_BG = "#FCF9EA"
@@ -31,50 +34,388 @@ COLOR_TEXT_LIGHT = "#7F8C8D"
 COLOR_BORDER = "#E0E0E0"
 COLOR_CARD = "#FFFFFF"
 
+# Compiled Qt resources (pyrcc5 resources.qrc -o resources_rc.py); fall back
+# to the image on disk when the module has not been generated.
+try:
+    from . import resources_rc  # noqa: F401
+    _LOGO_PATH = ':/Logo.png'
+except ImportError:
+    _LOGO_PATH = os.path.join(os.path.dirname(__file__), 'Logo.png')
+
+# Window icon, decoded once on first use (needs a QApplication)
+_APP_ICON: Optional[QIcon] = None
+
+
+def _get_app_icon() -> QIcon:
+    """Return the shared application icon, loading the logo on first call."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(QPixmap(_LOGO_PATH))
+    return _APP_ICON
+
+# Menu card accent colors, selected by the card's "cardColor" property
+CARD_COLORS = {
+    'primary': COLOR_PRIMARY,
+    'success': COLOR_SUCCESS,
+    'warning': COLOR_WARNING,
+    'danger': COLOR_DANGER,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _font(point_size: int, weight: int = QFont.Normal) -> QFont:
+    """Return a shared QFont for the given size and weight."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setWeight(weight)
+    return font
+
+
+@functools.lru_cache(maxsize=16)
+def _card_qss(key: str, color: str) -> str:
+    """Build (once per color) the stylesheet rules for menu cards of one accent color."""
+    return f"""
+    QFrame#menuCard[cardColor="{key}"] {{
+        background-color: white;
+        border: 3px solid {COLOR_BORDER};
+        border-radius: 16px;
+        padding: 20px;
+    }}
+    QFrame#menuCard[cardColor="{key}"]:hover {{
+        background-color: {color};
+        border: 3px solid {color};
+    }}
+    QLabel#cardTitle[cardColor="{key}"] {{
+        color: {color};
+    }}
+"""
+
+
+# Card rules for every accent color, interpolated once at import
+_CARD_QSS = "".join(_card_qss(key, color) for key, color in CARD_COLORS.items())
+
+
+# Application-wide stylesheet, applied once by MainWindow. Widgets opt in
+# through their object names (and the cardColor property for menu cards).
+GLOBAL_QSS = f"""
+    QMainWindow {{
+        background-color: {COLOR_BG_SECONDARY};
+    }}
+    
+    /* Connect dialog */
+    QDialog#connectDialog {{
+        background-color: {COLOR_BG};
+    }}
+    QDialog#connectDialog QLabel {{
+        color: {COLOR_TEXT};
+        font-size: 11pt;
+        font-weight: 500;
+    }}
+    QDialog#connectDialog QLineEdit, QDialog#connectDialog QSpinBox {{
+        background-color: {COLOR_BG_SECONDARY};
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 8px;
+        padding: 10px;
+        font-size: 11pt;
+        color: {COLOR_TEXT};
+    }}
+    QDialog#connectDialog QLineEdit:focus, QDialog#connectDialog QSpinBox:focus {{
+        border: 2px solid {COLOR_PRIMARY};
+    }}
+    QDialog#connectDialog QPushButton {{
+        background-color: {COLOR_PRIMARY};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 11pt;
+        font-weight: 600;
+    }}
+    QDialog#connectDialog QPushButton:hover {{
+        background-color: #3A7BC8;
+    }}
+    
+    /* Connection status */
+    QLabel#connLabel {{
+        color: white;
+        font-weight: 600;
+        font-size: 10pt;
+        padding: 8px;
+    }}
+    QLabel#connLabel[state="ok"] {{
+        background-color: {COLOR_SUCCESS};
+    }}
+    QLabel#connLabel[state="bad"] {{
+        background-color: {COLOR_DANGER};
+    }}
+    
+    /* Home page */
+    QWidget#homeHeader {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                    stop:0 #F5AFAF,
+                                    stop:0.5 #F9DFDF,
+                                    stop:1 #FBEFEF);
+    }}
+    QLabel#homeTitle {{
+        color: white;
+        padding: 10px;
+        background: transparent;
+    }}
+    QWidget#homeCards {{
+        background-color: {COLOR_BG_SECONDARY};
+    }}
+    QLabel#cardDesc {{
+        color: {COLOR_TEXT_LIGHT};
+    }}
+    {_CARD_QSS}
+    QLabel#cardTitle[active="true"], QLabel#cardDesc[active="true"] {{
+        color: white;
+    }}
+    
+    /* Shared back button */
+    QPushButton#backBtn {{
+        background-color: transparent;
+        color: {COLOR_TEXT};
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 11pt;
+        font-weight: 600;
+    }}
+    QPushButton#backBtn:hover {{
+        background-color: {COLOR_BG_SECONDARY};
+    }}
+    
+    /* Create game screen */
+    QLabel#createTitle {{
+        color: {COLOR_PRIMARY};
+        padding: 10px;
+    }}
+    QFrame#createCard, QFrame#createCard QFrame {{
+        background-color: white;
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 16px;
+        padding: 20px;
+    }}
+    QLabel#createFieldLabel {{
+        color: {COLOR_TEXT};
+    }}
+    QSpinBox#numPlayersSpin {{
+        background-color: {COLOR_BG_SECONDARY};
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 8px;
+        padding: 10px;
+        font-size: 12pt;
+        font-weight: 500;
+        min-width: 100px;
+        color: {COLOR_PRIMARY};
+    }}
+    QLabel#createInfo {{
+        color: {COLOR_TEXT_LIGHT};
+    }}
+    QPushButton#createBtn {{
+        background-color: {COLOR_PRIMARY};
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px;
+        font-size: 14pt;
+        font-weight: 700;
+    }}
+    QPushButton#createBtn:hover {{
+        background-color: #3A7BC8;
+    }}
+    QPushButton#createBtn:pressed {{
+        background-color: #2A6AB8;
+    }}
+    
+    /* Join game screen */
+    QPushButton#refreshBtn {{
+        background-color: {COLOR_SUCCESS};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 11pt;
+        font-weight: 600;
+    }}
+    QPushButton#refreshBtn:hover {{
+        background-color: #40B868;
+    }}
+    QLabel#joinTitle {{
+        color: {COLOR_SUCCESS};
+        padding: 10px;
+    }}
+    QListWidget#gamesList {{
+        background-color: {COLOR_BG_SECONDARY};
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 12px;
+        padding: 15px;
+        font-size: 10pt;
+    }}
+    QListWidget#gamesList::item {{
+        background-color: white;
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 10px;
+        padding: 10px;
+        margin: 8px;
+        color: {COLOR_TEXT};
+    }}
+    QListWidget#gamesList::item:selected {{
+        background-color: {COLOR_SUCCESS};
+        color: white;
+        border: 2px solid {COLOR_SUCCESS};
+    }}
+    QListWidget#gamesList::item:hover {{
+        background-color: #E8F8EF;
+    }}
+    QPushButton#joinBtn {{
+        background-color: {COLOR_SUCCESS};
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px;
+        font-size: 16pt;
+        font-weight: 700;
+    }}
+    QPushButton#joinBtn:hover:enabled {{
+        background-color: #40B868;
+    }}
+    QPushButton#joinBtn:disabled {{
+        background-color: {COLOR_BG_SECONDARY};
+        color: {COLOR_TEXT_LIGHT};
+    }}
+    
+    /* Profile screen */
+    QLabel#profileTitle {{
+        color: {COLOR_WARNING};
+        padding: 20px;
+    }}
+    QFrame#profileCard, QFrame#profileCard QFrame {{
+        background-color: white;
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 16px;
+        padding: 40px;
+    }}
+    QLabel#profileFieldLabel {{
+        color: {COLOR_TEXT};
+    }}
+    QLineEdit#profileInput {{
+        background-color: {COLOR_BG_SECONDARY};
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 10px;
+        padding: 10px;
+        font-size: 12pt;
+        color: {COLOR_TEXT};
+    }}
+    QLineEdit#profileInput:focus {{
+        border: 2px solid {COLOR_WARNING};
+    }}
+    QPushButton#saveBtn {{
+        background-color: {COLOR_WARNING};
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 10px;
+        font-size: 16pt;
+        font-weight: 700;
+    }}
+    QPushButton#saveBtn:hover {{
+        background-color: #E89616;
+    }}
+    QPushButton#saveBtn:pressed {{
+        background-color: #D88606;
+    }}
+    
+    /* Gameplay screen */
+    QLabel#gameIdLabel {{
+        color: {COLOR_TEXT};
+    }}
+    QPushButton#quitBtn {{
+        background-color: {COLOR_BG_SECONDARY};
+        color: {COLOR_TEXT};
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 8px;
+        padding: 8px 20px;
+        font-size: 10pt;
+        font-weight: 600;
+    }}
+    QPushButton#quitBtn:hover {{
+        background-color: {COLOR_DANGER};
+        color: white;
+        border: 2px solid {COLOR_DANGER};
+    }}
+    QLabel#statusLabel {{
+        background-color: {COLOR_BG_SECONDARY};
+        color: {COLOR_TEXT};
+        font-size: 15pt;
+        font-weight: 600;
+        padding: 18px;
+        border-radius: 12px;
+        border: 2px solid {COLOR_BORDER};
+    }}
+    QLabel#statusLabel[status="waiting"] {{
+        background-color: {COLOR_WARNING};
+        color: white;
+        border: 2px solid {COLOR_WARNING};
+    }}
+    QLabel#statusLabel[status="your_turn"] {{
+        background-color: {COLOR_SUCCESS};
+        color: white;
+        font-size: 16pt;
+        font-weight: 700;
+        border: 3px solid {COLOR_SUCCESS};
+    }}
+    QLabel#statusLabel[status="other_turn"] {{
+        border: 2px solid {COLOR_PRIMARY};
+    }}
+    QLabel#statusLabel[status="ended"] {{
+        background-color: {COLOR_WARNING};
+        color: white;
+        font-size: 16pt;
+        font-weight: 700;
+        border: 3px solid {COLOR_WARNING};
+    }}
+    QLabel#statusLabel[status="win"] {{
+        background-color: {COLOR_SUCCESS};
+        color: white;
+        font-size: 18pt;
+        font-weight: 700;
+        border: 4px solid {COLOR_SUCCESS};
+    }}
+    QLabel#statusLabel[status="lose"] {{
+        background-color: {COLOR_DANGER};
+        color: white;
+        font-size: 16pt;
+        font-weight: 700;
+        border: 3px solid {COLOR_DANGER};
+    }}
+    QLabel#playersLabel {{
+        color: {COLOR_TEXT_LIGHT};
+        padding: 10px;
+        background-color: {COLOR_BG};
+        border-radius: 8px;
+    }}
+"""
+
+
+def _make_back_button(parent=None) -> QPushButton:
+    """Create a "Back to Home" button styled by the shared backBtn rule."""
+    button = QPushButton("← Back to Home", parent)
+    button.setObjectName("backBtn")
+    return button
+
 
 class ConnectDialog(QDialog):
     """Dialog for connecting to server."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("connectDialog")
         self.setWindowTitle("Connect to Server")
         self.setModal(True)
         self.setMinimumWidth(400)
         
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLOR_BG};
-            }}
-            QLabel {{
-                color: {COLOR_TEXT};
-                font-size: 11pt;
-                font-weight: 500;
-            }}
-            QLineEdit, QSpinBox {{
-                background-color: {COLOR_BG_SECONDARY};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 11pt;
-                color: {COLOR_TEXT};
-            }}
-            QLineEdit:focus, QSpinBox:focus {{
-                border: 2px solid {COLOR_PRIMARY};
-            }}
-            QPushButton {{
-                background-color: {COLOR_PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 11pt;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: #3A7BC8;
-            }}
-        """)
-        
         layout = QFormLayout()
         layout.setSpacing(15)
         layout.setContentsMargins(30, 30, 30, 30)
@@ -99,6 +440,63 @@ class ConnectDialog(QDialog):
         return self.host_input.text(), self.port_input.value()
 
 
+class MenuCard(QFrame):
+    """Clickable home page card with a title and a description."""
+    
+    clicked = pyqtSignal()
+    
+    def __init__(self, title: str, description: str, color: str, parent=None):
+        super().__init__(parent)
+        self.setObjectName("menuCard")
+        self.setProperty("cardColor", color)
+        self.setAttribute(Qt.WA_Hover)
+        self.setMinimumSize(250, 130)
+        self.setCursor(Qt.PointingHandCursor)
+        
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignCenter)
+        layout.setSpacing(10)
+        
+        self.title_label = QLabel(title)
+        self.title_label.setObjectName("cardTitle")
+        self.title_label.setFont(_font(18, QFont.Bold))
+        self.title_label.setProperty("cardColor", color)
+        self.title_label.setAlignment(Qt.AlignCenter)
+        
+        self.desc_label = QLabel(description)
+        self.desc_label.setObjectName("cardDesc")
+        self.desc_label.setFont(_font(10))
+        self.desc_label.setAlignment(Qt.AlignCenter)
+        self.desc_label.setWordWrap(True)
+        
+        layout.addWidget(self.title_label)
+        layout.addWidget(self.desc_label)
+        self.setLayout(layout)
+    
+    def _set_active(self, active: bool):
+        """Flip the labels' "active" property so hover styling stays flat."""
+        for label in (self.title_label, self.desc_label):
+            label.setProperty("active", active)
+            label.style().unpolish(label)
+            label.style().polish(label)
+    
+    def enterEvent(self, event):
+        """Highlight the card labels on hover."""
+        self._set_active(True)
+        super().enterEvent(event)
+    
+    def leaveEvent(self, event):
+        """Restore the card labels when the cursor leaves."""
+        self._set_active(False)
+        super().leaveEvent(event)
+    
+    def mouseReleaseEvent(self, event):
+        """Emit clicked for a left-button release inside the card."""
+        if event.button() == Qt.LeftButton and self.rect().contains(event.pos()):
+            self.clicked.emit()
+        super().mouseReleaseEvent(event)
+
+
 class HomePageWidget(QWidget):
     """Home page with navigation options."""
     
@@ -108,42 +506,33 @@ class HomePageWidget(QWidget):
     
     def _init_ui(self):
         """Initialize UI."""
+        # Batch child construction into a single geometry pass
+        self.setUpdatesEnabled(False)
+        
         layout = QVBoxLayout()
         layout.setSpacing(0)
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Header
         header = QWidget()
-        header.setStyleSheet(f"""
-  background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-             stop:0 #F5AFAF, 
-             stop:0.5 #F9DFDF, 
-             stop:1 #FBEFEF,  
-             border-radius: 100px
-             );
-""")
-
+        header.setObjectName("homeHeader")
+        
         header_layout = QVBoxLayout()
         header_layout.setContentsMargins(40, 50, 40, 50)
         
         title = QLabel("Tic-Tac-Toe Bar Ilan")
+        title.setObjectName("homeTitle")
+        title.setFont(_font(38, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("""
-            font-size: 38pt;
-            font-weight: 700;
-            color: white;
-            padding: 10px;
-            background: transparent;
-        """)
         header_layout.addWidget(title)
-    
+        
         
         header.setLayout(header_layout)
         layout.addWidget(header)
         
         # Menu Cards Container
         cards_container = QWidget()
-        cards_container.setStyleSheet(f"background-color: {COLOR_BG_SECONDARY};")
+        cards_container.setObjectName("homeCards")
         cards_layout = QVBoxLayout()
         cards_layout.setSpacing(20)
         cards_layout.setContentsMargins(60, 60, 60, 60)
@@ -156,7 +545,7 @@ class HomePageWidget(QWidget):
         self.create_card = self._create_menu_card(
             "Create Game",
             "Start a new game and invite friends",
-            COLOR_PRIMARY
+            'primary'
         )
         grid.addWidget(self.create_card, 0, 0)
         
@@ -164,7 +553,7 @@ class HomePageWidget(QWidget):
         self.join_card = self._create_menu_card(
             "Join Game",
             "Join an existing game room",
-            COLOR_SUCCESS
+            'success'
         )
         grid.addWidget(self.join_card, 0, 1)
         
@@ -172,7 +561,7 @@ class HomePageWidget(QWidget):
         self.profile_card = self._create_menu_card(
             "Personal Info",
             "Update your name and email",
-            COLOR_WARNING
+            'warning'
         )
         grid.addWidget(self.profile_card, 1, 0)
         
@@ -180,7 +569,7 @@ class HomePageWidget(QWidget):
         self.exit_card = self._create_menu_card(
             " Exit",
             "Close the application",
-            COLOR_DANGER
+            'danger'
         )
         grid.addWidget(self.exit_card, 1, 1)
         
@@ -190,66 +579,13 @@ class HomePageWidget(QWidget):
         cards_container.setLayout(cards_layout)
         layout.addWidget(cards_container, 1)
         
+        layout.setSizeConstraint(QLayout.SetMinimumSize)
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
     
-    def _create_menu_card(self, title: str, description: str, color: str) -> QPushButton:
-        """Create a menu card button."""
-        card = QPushButton()
-        card.setMinimumSize(250, 130)
-        card.setCursor(Qt.PointingHandCursor)
-        
-        # Create layout for card content
-        card_layout = QVBoxLayout()
-        card_layout.setAlignment(Qt.AlignCenter)
-        card_layout.setSpacing(10)
-        
-        title_label = QLabel(title)
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            font-size: 18pt;
-            font-weight: 700;
-            color: {color};
-        """)
-        
-        desc_label = QLabel(description)
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet(f"""
-            font-size: 10pt;
-            color: {COLOR_TEXT_LIGHT};
-        """)
-        
-        card_layout.addWidget(title_label)
-        card_layout.addWidget(desc_label)
-        
-        container = QWidget()
-        container.setLayout(card_layout)
-        
-        card_main_layout = QVBoxLayout()
-        card_main_layout.addWidget(container)
-        card.setLayout(card_main_layout)
-        
-        card.setStyleSheet(f"""
-            QPushButton {{
-                background-color: white;
-                border: 3px solid {COLOR_BORDER};
-                border-radius: 16px;
-                padding: 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {color};
-                border: 3px solid {color};
-            }}
-            QPushButton:hover QLabel {{
-                color: white !important;
-            }}
-            QPushButton:pressed {{
-                background-color: {color};
-                
-            }}
-        """)
-        
-        return card
+    def _create_menu_card(self, title: str, description: str, color: str) -> MenuCard:
+        """Create a menu card (color is a CARD_COLORS key)."""
+        return MenuCard(title, description, color)
 
 
 class CreateGameWidget(QWidget):
@@ -261,113 +597,68 @@ class CreateGameWidget(QWidget):
     
     def _init_ui(self):
         """Initialize UI."""
+        # Batch child construction into a single geometry pass
+        self.setUpdatesEnabled(False)
+        
         layout = QVBoxLayout()
         layout.setSpacing(20)
         layout.setContentsMargins(50, 30, 50, 30)
         
         # Back button
         back_layout = QHBoxLayout()
-        self.back_btn = QPushButton("← Back to Home")
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {COLOR_TEXT};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 10pt;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {COLOR_BG_SECONDARY};
-            }}
-        """)
+        self.back_btn = _make_back_button(self)
         back_layout.addWidget(self.back_btn)
         back_layout.addStretch()
         layout.addLayout(back_layout)
         
         # Title
         title = QLabel("Create New Game")
+        title.setObjectName("createTitle")
+        title.setFont(_font(22, QFont.DemiBold))
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(f"""
-            font-size: 22pt;
-            font-weight: 600;
-            color: {COLOR_PRIMARY};
-            padding: 10px;
-        """)
         layout.addWidget(title)
         
         # Card
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 16px;
-                padding: 20px;
-            }}
-        """)
+        card.setObjectName("createCard")
         card_layout = QVBoxLayout()
         card_layout.setSpacing(25)
         
         # Number of players
         players_layout = QHBoxLayout()
         players_label = QLabel("Number of Players:")
-        players_label.setStyleSheet(f"color: {COLOR_TEXT}; font-size: 10pt; font-weight: 500;")
+        players_label.setObjectName("createFieldLabel")
+        players_label.setFont(_font(10, QFont.Medium))
         players_layout.addWidget(players_label)
         
         self.num_players_spin = QSpinBox()
+        self.num_players_spin.setObjectName("numPlayersSpin")
         self.num_players_spin.setRange(2, 10)
         self.num_players_spin.setValue(2)
-        self.num_players_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background-color: {COLOR_BG_SECONDARY};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 12pt;
-                font-weight: 500;
-                min-width: 100px;
-                color: {COLOR_PRIMARY};
-            }}
-        """)
         players_layout.addWidget(self.num_players_spin)
         players_layout.addStretch()
         card_layout.addLayout(players_layout)
         
         # Info text
         info = QLabel("Choose how many players can join this game.\n After creating, you can join the game from the tab 'Join Game'.\n Share the Game ID with your friends to invite them!")
-        info.setStyleSheet(f"color: {COLOR_TEXT_LIGHT}; font-size: 11pt;")
+        info.setObjectName("createInfo")
+        info.setFont(_font(11))
         info.setWordWrap(True)
         card_layout.addWidget(info)
         
         # Create button
         self.create_btn = QPushButton(" Create Game")
+        self.create_btn.setObjectName("createBtn")
         self.create_btn.setMinimumHeight(50)
-        self.create_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px;
-                font-size: 14pt;
-                font-weight: 700;
-            }}
-            QPushButton:hover {{
-                background-color: #3A7BC8;
-            }}
-            QPushButton:pressed {{
-                background-color: #2A6AB8;
-            }}
-        """)
         card_layout.addWidget(self.create_btn)
         
         card.setLayout(card_layout)
         layout.addWidget(card)
         layout.addStretch()
         
+        layout.setSizeConstraint(QLayout.SetMinimumSize)
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
 
 
 class JoinGameWidget(QWidget):
@@ -385,105 +676,33 @@ class JoinGameWidget(QWidget):
         
         # Back button
         back_layout = QHBoxLayout()
-        self.back_btn = QPushButton("← Back to Home")
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {COLOR_TEXT};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 11pt;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {COLOR_BG_SECONDARY};
-            }}
-        """)
+        self.back_btn = _make_back_button(self)
         back_layout.addWidget(self.back_btn)
         back_layout.addStretch()
         
         self.refresh_btn = QPushButton(" Refresh")
-        self.refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_SUCCESS};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 11pt;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: #40B868;
-            }}
-        """)
+        self.refresh_btn.setObjectName("refreshBtn")
         back_layout.addWidget(self.refresh_btn)
         layout.addLayout(back_layout)
         
         # Title
         title = QLabel("Join Game")
+        title.setObjectName("joinTitle")
+        title.setFont(_font(24, QFont.DemiBold))
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(f"""
-            font-size: 24pt;
-            font-weight: 600;
-            color: {COLOR_SUCCESS};
-            padding: 10px;
-        """)
         layout.addWidget(title)
         
         # Games list
         self.games_list = QListWidget()
-        self.games_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {COLOR_BG_SECONDARY};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 12px;
-                padding: 15px;
-                font-size: 10pt;
-            }}
-            QListWidget::item {{
-                background-color: white;
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 10px;
-                padding: 10px;
-                margin: 8px;
-                color: {COLOR_TEXT};
-            }}
-            QListWidget::item:selected {{
-                background-color: {COLOR_SUCCESS};
-                color: white;
-                border: 2px solid {COLOR_SUCCESS};
-            }}
-            QListWidget::item:hover {{
-                background-color: #E8F8EF;
-            }}
-        """)
+        self.games_list.setObjectName("gamesList")
         self.games_list.setMinimumHeight(100)
         layout.addWidget(self.games_list)
         
         # Join button
         self.join_btn = QPushButton("Join Selected Game")
+        self.join_btn.setObjectName("joinBtn")
         self.join_btn.setEnabled(False)
         self.join_btn.setMinimumHeight(50)
-        self.join_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_SUCCESS};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px;
-                font-size: 16pt;
-                font-weight: 700;
-            }}
-            QPushButton:hover:enabled {{
-                background-color: #40B868;
-            }}
-            QPushButton:disabled {{
-                background-color: {COLOR_BG_SECONDARY};
-                color: {COLOR_TEXT_LIGHT};
-            }}
-        """)
         layout.addWidget(self.join_btn)
         
         self.setLayout(layout)
@@ -494,6 +713,34 @@ class JoinGameWidget(QWidget):
     def _on_selection_changed(self):
         """Handle game selection change."""
         self.join_btn.setEnabled(len(self.games_list.selectedItems()) > 0)
+    
+    def populate(self, games: List[Dict]):
+        """Replace the list contents with the given games in a single repaint."""
+        games_list = self.games_list
+        games_list.setUpdatesEnabled(False)
+        games_list.blockSignals(True)
+        try:
+            games_list.clear()
+            
+            if not games:
+                item = QListWidgetItem("No games available. Create one!")
+                item.setFlags(Qt.NoItemFlags)
+                games_list.addItem(item)
+                return
+            
+            for game in games:
+                game_id = game.get('game_id')
+                num_players = game.get('num_players')
+                current_count = game.get('current_player_count')
+                
+                item_text = f" {game_id}  •  {current_count}/{num_players} players"
+                item = QListWidgetItem(item_text)
+                item.setData(Qt.UserRole, game_id)
+                games_list.addItem(item)
+        finally:
+            games_list.blockSignals(False)
+            games_list.setUpdatesEnabled(True)
+            self._on_selection_changed()
 
 
 class ProfileWidget(QWidget):
@@ -505,134 +752,80 @@ class ProfileWidget(QWidget):
     
     def _init_ui(self):
         """Initialize UI."""
+        # Batch child construction into a single geometry pass
+        self.setUpdatesEnabled(False)
+        
         layout = QVBoxLayout()
         layout.setSpacing(20)
         layout.setContentsMargins(50, 30, 50, 30)
         
         # Back button
         back_layout = QHBoxLayout()
-        self.back_btn = QPushButton("← Back to Home")
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {COLOR_TEXT};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 11pt;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {COLOR_BG_SECONDARY};
-            }}
-        """)
+        self.back_btn = _make_back_button(self)
         back_layout.addWidget(self.back_btn)
         back_layout.addStretch()
         layout.addLayout(back_layout)
         
         # Title
         title = QLabel("Personal Information")
+        title.setObjectName("profileTitle")
+        title.setFont(_font(28, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(f"""
-            font-size: 28pt;
-            font-weight: 700;
-            color: {COLOR_WARNING};
-            padding: 20px;
-        """)
         layout.addWidget(title)
         
         # Card
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 16px;
-                padding: 40px;
-            }}
-        """)
+        card.setObjectName("profileCard")
         card_layout = QVBoxLayout()
         card_layout.setSpacing(20)
         
         # Name
         name_label = QLabel("Your Name:")
-        name_label.setStyleSheet(f"color: {COLOR_TEXT}; font-size: 12pt; font-weight: 500;")
+        name_label.setObjectName("profileFieldLabel")
+        name_label.setFont(_font(12, QFont.Medium))
         card_layout.addWidget(name_label)
         
         self.name_input = QLineEdit()
+        self.name_input.setObjectName("profileInput")
         self.name_input.setPlaceholderText("Enter your name...")
-        self.name_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {COLOR_BG_SECONDARY};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 10px;
-                padding: 10px;
-                font-size: 12pt;
-                color: {COLOR_TEXT};
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {COLOR_WARNING};
-            }}
-        """)
         card_layout.addWidget(self.name_input)
         
         # Email
         email_label = QLabel("Email Address:")
-        email_label.setStyleSheet(f"color: {COLOR_TEXT}; font-size: 12pt; font-weight: 500;")
+        email_label.setObjectName("profileFieldLabel")
+        email_label.setFont(_font(12, QFont.Medium))
         card_layout.addWidget(email_label)
         
         self.email_input = QLineEdit()
+        self.email_input.setObjectName("profileInput")
         self.email_input.setPlaceholderText("Enter your email...")
-        self.email_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {COLOR_BG_SECONDARY};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 10px;
-                padding: 10px;
-                font-size: 12pt;
-                color: {COLOR_TEXT};
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {COLOR_WARNING};
-            }}
-        """)
         card_layout.addWidget(self.email_input)
         
         # Save button
         self.save_btn = QPushButton("Save Changes")
+        self.save_btn.setObjectName("saveBtn")
         self.save_btn.setMinimumHeight(50)
-        self.save_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_WARNING};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 10px;
-                font-size: 16pt;
-                font-weight: 700;
-            }}
-            QPushButton:hover {{
-                background-color: #E89616;
-            }}
-            QPushButton:pressed {{
-                background-color: #D88606;
-            }}
-        """)
         card_layout.addWidget(self.save_btn)
         
         card.setLayout(card_layout)
         layout.addWidget(card)
         layout.addStretch()
         
+        layout.setSizeConstraint(QLayout.SetMinimumSize)
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
 
 
 class GamePlayWidget(QWidget):
     """Widget for playing the game."""
     
+    # Forwarded from whichever board is active (row, col)
+    cell_clicked = pyqtSignal(int, int)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.board_widget: Optional[BoardWidget] = None
+        self.board_widget: Optional['BoardWidget'] = None
+        self._board_cache: Dict[int, 'BoardWidget'] = {}
         self._init_ui()
     
     def _init_ui(self):
@@ -645,60 +838,28 @@ class GamePlayWidget(QWidget):
         top_layout = QHBoxLayout()
         
         self.game_id_label = QLabel("Game")
-        self.game_id_label.setStyleSheet(f"""
-            font-size: 13pt;
-            color: {COLOR_TEXT};
-            font-weight: 600;
-        """)
+        self.game_id_label.setObjectName("gameIdLabel")
+        self.game_id_label.setFont(_font(13, QFont.DemiBold))
         top_layout.addWidget(self.game_id_label)
         top_layout.addStretch()
         
         self.quit_btn = QPushButton("← Leave Game")
-        self.quit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_BG_SECONDARY};
-                color: {COLOR_TEXT};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 8px;
-                padding: 8px 20px;
-                font-size: 10pt;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {COLOR_DANGER};
-                color: white;
-                border: 2px solid {COLOR_DANGER};
-            }}
-        """)
+        self.quit_btn.setObjectName("quitBtn")
         top_layout.addWidget(self.quit_btn)
         
         layout.addLayout(top_layout)
         
         # Status label
         self.status_label = QLabel("Waiting for players...")
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet(f"""
-            background-color: {COLOR_BG_SECONDARY};
-            color: {COLOR_TEXT};
-            font-size: 15pt;
-            font-weight: 600;
-            padding: 18px;
-            border-radius: 12px;
-            border: 2px solid {COLOR_BORDER};
-        """)
         layout.addWidget(self.status_label)
         
         # Players info
         self.players_label = QLabel("Players:")
+        self.players_label.setObjectName("playersLabel")
+        self.players_label.setFont(_font(11, QFont.Medium))
         self.players_label.setAlignment(Qt.AlignCenter)
-        self.players_label.setStyleSheet(f"""
-            font-size: 11pt;
-            color: {COLOR_TEXT_LIGHT};
-            font-weight: 500;
-            padding: 10px;
-            background-color: {COLOR_BG};
-            border-radius: 8px;
-        """)
         layout.addWidget(self.players_label)
         
         # Board container
@@ -710,71 +871,133 @@ class GamePlayWidget(QWidget):
         
         self.setLayout(layout)
     
+    def set_status(self, status: str, text: str):
+        """Set the status text and restyle only when the status kind changes."""
+        self.status_label.setText(text)
+        if self.status_label.property("status") == status:
+            return
+        self.status_label.setProperty("status", status)
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
+    
     def set_board_size(self, size: int):
-        """Create board with specified size."""
+        """Show a cleared board of the specified size, reusing cached boards."""
         if self.board_widget:
-            self.board_layout.removeWidget(self.board_widget)
-            self.board_widget.deleteLater()
-        
-        self.board_widget = BoardWidget(size)
-        self.board_layout.addWidget(self.board_widget)
+            self.board_widget.setVisible(False)
+        
+        board = self._board_cache.get(size)
+        if board is None:
+            from .board_widget import BoardWidget
+            board = BoardWidget(size)
+            board.setVisible(False)
+            board.cell_clicked.connect(self.cell_clicked)
+            self.board_layout.addWidget(board)
+            self._board_cache[size] = board
+        
+        board.clear_board()
+        board.setVisible(True)
+        self.board_widget = board
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
     PROFILE_FILE = "user_profile.json"
+    _PROFILE_CACHE: Optional[Dict] = None
     
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Tic-Tac-Toe")
         #logo
-        self.setWindowIcon(QIcon(os.path.join(os.path.dirname(__file__), 'Logo.png')))
+        self.setWindowIcon(_get_app_icon())
         self.setMinimumSize(800, 600)
         
-        # Apply main window styling
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {COLOR_BG_SECONDARY};
-            }}
-        """)
+        # Apply application-wide styling once
+        QApplication.instance().setStyleSheet(GLOBAL_QSS)
         
         # Load user profile
         self.user_profile = self._load_profile()
         
-        # Network client (disable logging)
-        import logging
-        logging.basicConfig(level=logging.CRITICAL)
+        # Profile writes are debounced and skipped when nothing changed
+        self._last_saved_profile: Optional[str] = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_profile)
         
+        # Network client (its logger is silenced in network_client)
+        from .network_client import NetworkClient
         self.client = NetworkClient()
         self.client.message_received.connect(self._on_message_received)
         self.client.connection_lost.connect(self._on_connection_lost)
         self.client.connected.connect(self._on_connected)
+        self.client.connect_finished.connect(self._on_connect_finished)
         
         # Game state
         self.current_game_id: Optional[str] = None
         self.my_player_id: Optional[str] = None
         self.my_symbol: Optional[str] = None
         self.game_state: Optional[Dict] = None
+        self._last_grid: Optional[List[List[Optional[str]]]] = None
+        self._current_board_size: Optional[int] = None
+        self._board_enabled: Optional[bool] = None
+        self._last_players_text: Optional[str] = None
+        
+        # Reusable dialog for connection and server errors
+        self._err_box = QMessageBox(self)
+        self._err_box.setStandardButtons(QMessageBox.Ok)
+        
+        # GAME_STATE bursts are coalesced; only the latest state is rendered
+        self._pending_state: Optional[Dict] = None
+        self._state_timer = QTimer(self)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(30)
+        self._state_timer.timeout.connect(self._flush_game_state)
+        
+        # Server message dispatch table
+        self._msg_handlers = {
+            MessageType.GAME_CREATED.value: self._handle_game_created,
+            MessageType.GAME_JOINED.value: self._handle_game_joined,
+            MessageType.GAME_LIST.value: self._handle_game_list,
+            MessageType.GAME_STATE.value: self._queue_game_state,
+            MessageType.GAME_OVER.value: self._handle_game_over,
+            MessageType.ERROR.value: self._handle_error,
+        }
         
         self._init_ui()
         self._show_connect_dialog()
     
     def _load_profile(self) -> Dict:
-        """Load user profile from file."""
-        try:
-            if os.path.exists(self.PROFILE_FILE):
-                with open(self.PROFILE_FILE, 'r') as f:
-                    return json.load(f)
-        except:
-            pass
-        return {'name': 'Player', 'email': ''}
+        """Load user profile from file (read once per process)."""
+        cls = type(self)
+        if cls._PROFILE_CACHE is None:
+            try:
+                with open(self.PROFILE_FILE, 'rb') as f:
+                    cls._PROFILE_CACHE = json.loads(f.read())
+            except FileNotFoundError:
+                cls._PROFILE_CACHE = {'name': 'Player', 'email': ''}
+            except:
+                return {'name': 'Player', 'email': ''}
+        return dict(cls._PROFILE_CACHE)
     
     def _save_profile(self):
-        """Save user profile to file."""
+        """Schedule the user profile to be written to file."""
+        self._save_timer.start()
+    
+    def _flush_profile(self):
+        """Write the user profile to file atomically, if it changed."""
+        self._save_timer.stop()
+        payload = json.dumps(self.user_profile)
+        if payload == self._last_saved_profile:
+            return
+        tmp_path = self.PROFILE_FILE + ".tmp"
         try:
-            with open(self.PROFILE_FILE, 'w') as f:
-                json.dump(self.user_profile, f)
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.PROFILE_FILE)
+            self._last_saved_profile = payload
+            type(self)._PROFILE_CACHE = dict(self.user_profile)
         except Exception as e:
             print(f"Error saving profile: {e}")
     
@@ -789,14 +1012,9 @@ class MainWindow(QMainWindow):
         
         # Connection status
         self.connection_label = QLabel("● Not Connected")
+        self.connection_label.setObjectName("connLabel")
+        self.connection_label.setProperty("state", "bad")
         self.connection_label.setAlignment(Qt.AlignCenter)
-        self.connection_label.setStyleSheet(f"""
-            background-color: {COLOR_DANGER};
-            color: white;
-            font-weight: 600;
-            font-size: 10pt;
-            padding: 8px;
-        """)
         layout.addWidget(self.connection_label)
         
         # Stacked widget for different views
@@ -810,53 +1028,72 @@ class MainWindow(QMainWindow):
         self.home_widget.exit_card.clicked.connect(self.close)
         self.stacked_widget.addWidget(self.home_widget)
         
-        # Create game view
-        self.create_widget = CreateGameWidget()
-        self.create_widget.back_btn.clicked.connect(self._show_home)
-        self.create_widget.create_btn.clicked.connect(self._on_create_game)
-        self.stacked_widget.addWidget(self.create_widget)
-        
-        # Join game view
-        self.join_widget = JoinGameWidget()
-        self.join_widget.back_btn.clicked.connect(self._show_home)
-        self.join_widget.refresh_btn.clicked.connect(self._on_refresh_games)
-        self.join_widget.join_btn.clicked.connect(self._on_join_game)
-        self.stacked_widget.addWidget(self.join_widget)
-        
-        # Profile view
-        self.profile_widget = ProfileWidget()
-        self.profile_widget.back_btn.clicked.connect(self._show_home)
-        self.profile_widget.save_btn.clicked.connect(self._on_save_profile)
-        self.profile_widget.name_input.setText(self.user_profile['name'])
-        self.profile_widget.email_input.setText(self.user_profile['email'])
-        self.stacked_widget.addWidget(self.profile_widget)
-        
-        # Gameplay view
-        self.gameplay_widget = GamePlayWidget()
-        self.gameplay_widget.quit_btn.clicked.connect(self._on_quit_game)
-        self.stacked_widget.addWidget(self.gameplay_widget)
+        # Secondary views are built on first use
+        self.create_widget: Optional[CreateGameWidget] = None
+        self.join_widget: Optional[JoinGameWidget] = None
+        self.profile_widget: Optional[ProfileWidget] = None
+        self.gameplay_widget: Optional[GamePlayWidget] = None
         
         layout.addWidget(self.stacked_widget)
         
         # Show home page
         self.stacked_widget.setCurrentWidget(self.home_widget)
     
+    def _ensure_create_widget(self) -> CreateGameWidget:
+        """Build the create game view on first use."""
+        if self.create_widget is None:
+            self.create_widget = CreateGameWidget()
+            self.create_widget.back_btn.clicked.connect(self._show_home)
+            self.create_widget.create_btn.clicked.connect(self._on_create_game)
+            self.stacked_widget.addWidget(self.create_widget)
+        return self.create_widget
+    
+    def _ensure_join_widget(self) -> JoinGameWidget:
+        """Build the join game view on first use."""
+        if self.join_widget is None:
+            self.join_widget = JoinGameWidget()
+            self.join_widget.back_btn.clicked.connect(self._show_home)
+            self.join_widget.refresh_btn.clicked.connect(self._on_refresh_games)
+            self.join_widget.join_btn.clicked.connect(self._on_join_game)
+            self.stacked_widget.addWidget(self.join_widget)
+        return self.join_widget
+    
+    def _ensure_profile_widget(self) -> ProfileWidget:
+        """Build the profile view on first use."""
+        if self.profile_widget is None:
+            self.profile_widget = ProfileWidget()
+            self.profile_widget.back_btn.clicked.connect(self._show_home)
+            self.profile_widget.save_btn.clicked.connect(self._on_save_profile)
+            self.profile_widget.name_input.setText(self.user_profile['name'])
+            self.profile_widget.email_input.setText(self.user_profile['email'])
+            self.stacked_widget.addWidget(self.profile_widget)
+        return self.profile_widget
+    
+    def _ensure_gameplay_widget(self) -> GamePlayWidget:
+        """Build the gameplay view on first use."""
+        if self.gameplay_widget is None:
+            self.gameplay_widget = GamePlayWidget()
+            self.gameplay_widget.quit_btn.clicked.connect(self._on_quit_game)
+            self.gameplay_widget.cell_clicked.connect(self._on_cell_clicked)
+            self.stacked_widget.addWidget(self.gameplay_widget)
+        return self.gameplay_widget
+    
     def _show_home(self):
         """Show home page."""
         self.stacked_widget.setCurrentWidget(self.home_widget)
     
     def _show_create_game(self):
         """Show create game screen."""
-        self.stacked_widget.setCurrentWidget(self.create_widget)
+        self.stacked_widget.setCurrentWidget(self._ensure_create_widget())
     
     def _show_join_game(self):
         """Show join game screen."""
-        self.stacked_widget.setCurrentWidget(self.join_widget)
+        self.stacked_widget.setCurrentWidget(self._ensure_join_widget())
         self._on_refresh_games()
     
     def _show_profile(self):
         """Show profile screen."""
-        self.stacked_widget.setCurrentWidget(self.profile_widget)
+        self.stacked_widget.setCurrentWidget(self._ensure_profile_widget())
     
     def _show_connect_dialog(self):
         """Show connection dialog."""
@@ -868,53 +1105,71 @@ class MainWindow(QMainWindow):
             self.close()
     
     def _connect_to_server(self, host: str, port: int):
-        """Connect to the server."""
-        success, error = self.client.connect(host, port)
-        if not success:
-            QMessageBox.critical(self, "Connection Error", error)
-            self._show_connect_dialog()
+        """Start connecting to the server without blocking the UI."""
+        self.connection_label.setText(f"● Connecting to {host}:{port}...")
+        self.client.connect_async(host, port)
+    
+    @pyqtSlot(bool, str)
+    def _on_connect_finished(self, success: bool, error: str):
+        """Handle the result of a connection attempt."""
+        if success:
+            return
+        self.connection_label.setText("● Not Connected")
+        self._show_error("Connection Error", error, QMessageBox.Critical)
+        self._show_connect_dialog()
+    
+    def _show_error(self, title: str, text: str, icon=QMessageBox.Warning):
+        """Show an error in the shared message box."""
+        self._err_box.setIcon(icon)
+        self._err_box.setWindowTitle(title)
+        self._err_box.setText(text)
+        self._err_box.exec_()
+    
+    def _set_connection_state(self, state: str):
+        """Switch the connection label's style via its "state" property."""
+        if self.connection_label.property("state") == state:
+            return
+        self.connection_label.setProperty("state", state)
+        style = self.connection_label.style()
+        style.unpolish(self.connection_label)
+        style.polish(self.connection_label)
     
     @pyqtSlot()
     def _on_connected(self):
         """Handle successful connection."""
-        self.connection_label.setText(f"● Connected to Server")
-        self.connection_label.setStyleSheet(f"""
-            background-color: {COLOR_SUCCESS};
-            color: white;
-            font-weight: 600;
-            font-size: 10pt;
-            padding: 8px;
-        """)
+        self.connection_label.setText("● Connected to Server")
+        self._set_connection_state("ok")
     
     @pyqtSlot()
     def _on_connection_lost(self):
         """Handle connection loss."""
         self.connection_label.setText("● Connection Lost")
-        self.connection_label.setStyleSheet(f"""
-            background-color: {COLOR_DANGER};
-            color: white;
-            font-weight: 600;
-            font-size: 10pt;
-            padding: 8px;
-        """)
-        QMessageBox.warning(self, "Connection Lost", "Connection to server was lost")
+        self._set_connection_state("bad")
+        self._show_error("Connection Lost", "Connection to server was lost")
         self._show_home()
     
     @pyqtSlot(str, dict)
     def _on_message_received(self, msg_type: str, data: Dict):
         """Handle received message from server."""
-        if msg_type == MessageType.GAME_CREATED.value:
-            self._handle_game_created(data)
-        elif msg_type == MessageType.GAME_JOINED.value:
-            self._handle_game_joined(data)
-        elif msg_type == MessageType.GAME_LIST.value:
-            self._handle_game_list(data)
-        elif msg_type == MessageType.GAME_STATE.value:
+        handler = self._msg_handlers.get(msg_type)
+        if handler:
+            # Other messages must see the latest board first
+            if handler != self._queue_game_state:
+                self._flush_game_state()
+            handler(data)
+    
+    def _queue_game_state(self, data: Dict):
+        """Keep the latest GAME_STATE and render it on the next throttle tick."""
+        self._pending_state = data
+        if not self._state_timer.isActive():
+            self._state_timer.start()
+    
+    def _flush_game_state(self):
+        """Render the pending GAME_STATE, if any."""
+        self._state_timer.stop()
+        data, self._pending_state = self._pending_state, None
+        if data is not None:
             self._handle_game_state(data)
-        elif msg_type == MessageType.GAME_OVER.value:
-            self._handle_game_over(data)
-        elif msg_type == MessageType.ERROR.value:
-            self._handle_error(data)
     
     def _handle_game_created(self, data: Dict):
         """Handle GAME_CREATED message."""
@@ -928,65 +1183,63 @@ class MainWindow(QMainWindow):
         self.my_player_id = data.get('player_id')
         self.my_symbol = data.get('symbol')
         
-        self.stacked_widget.setCurrentWidget(self.gameplay_widget)
+        self.stacked_widget.setCurrentWidget(self._ensure_gameplay_widget())
         self.gameplay_widget.game_id_label.setText(f" Game: {self.current_game_id}")
     
     def _handle_game_list(self, data: Dict):
         """Handle GAME_LIST message."""
-        games = data.get('games', [])
-        self.join_widget.games_list.clear()
-        
-        if not games:
-            item = QListWidgetItem("No games available. Create one!")
-            item.setFlags(Qt.NoItemFlags)
-            self.join_widget.games_list.addItem(item)
-            return
-        
-        for game in games:
-            game_id = game.get('game_id')
-            num_players = game.get('num_players')
-            current_count = game.get('current_player_count')
-            
-            item_text = f" {game_id}  •  {current_count}/{num_players} players"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, game_id)
-            self.join_widget.games_list.addItem(item)
+        self._ensure_join_widget().populate(data.get('games', []))
     
     def _handle_game_state(self, data: Dict):
-        """Handle GAME_STATE message."""
+        """
+        Handle GAME_STATE message.
+        
+        Everything below only schedules update() (never repaint()), so Qt
+        coalesces the changes into one paint per event loop pass.
+        """
+        # Repeated identical states (often the same cached dict) change nothing
+        if data is self.game_state or data == self.game_state:
+            return
         self.game_state = data
+        self._ensure_gameplay_widget()
         
-        board_data = data.get('board', {})
+        board_data = data.get('board') or {}
         board_size = board_data.get('size', 3)
         
-        if not self.gameplay_widget.board_widget or \
-           self.gameplay_widget.board_widget.size != board_size:
-            self.gameplay_widget.set_board_size(board_size)
-            self.gameplay_widget.board_widget.cell_clicked.connect(self._on_cell_clicked)
+        grid = board_data.get('grid') or []
+        last_grid = self._last_grid
         
-        grid = board_data.get('grid', [])
-        self.gameplay_widget.board_widget.set_board_state(grid)
+        if board_size != self._current_board_size:
+            self.gameplay_widget.set_board_size(board_size)
+            self._current_board_size = board_size
+            self._board_enabled = None
+            last_grid = None
         
-        players = data.get('players', [])
-        players_text = "  •  ".join([
-            f"{p['symbol']} {p['name']}" + (" (left)" if not p['is_active'] else "")
-            for p in players
-        ])
-        self.gameplay_widget.players_label.setText(players_text)
+        if last_grid is None or len(last_grid) != len(grid):
+            self.gameplay_widget.board_widget.set_board_state(grid)
+        else:
+            changes = [
+                (r, c, symbol)
+                for r, (row, last_row) in enumerate(zip(grid, last_grid))
+                if row != last_row
+                for c, symbol in enumerate(row)
+                if c >= len(last_row) or symbol != last_row[c]
+            ]
+            if changes:
+                self.gameplay_widget.board_widget.apply_cell_changes(changes)
+        self._last_grid = grid
+        
+        players = data.get('players') or ()
+        # Formatted by NetworkClient when the message was decoded
+        players_text = data.get('_players_text', '')
+        if players_text != self._last_players_text:
+            self.gameplay_widget.players_label.setText(players_text)
+            self._last_players_text = players_text
         
         state = data.get('state')
         if state == GameState.WAITING.value:
-            self.gameplay_widget.status_label.setText(" Waiting for players to join...")
-            self.gameplay_widget.status_label.setStyleSheet(f"""
-                background-color: {COLOR_WARNING};
-                color: white;
-                font-size: 15pt;
-                font-weight: 600;
-                padding: 18px;
-                border-radius: 12px;
-                border: 2px solid {COLOR_WARNING};
-            """)
-            self.gameplay_widget.board_widget.set_enabled(False)
+            self.gameplay_widget.set_status("waiting", " Waiting for players to join...")
+            self._set_board_enabled(False)
         
         elif state == GameState.PLAYING.value:
             current_player_id = data.get('current_player_id')
@@ -994,63 +1247,36 @@ class MainWindow(QMainWindow):
             
             if current_player:
                 if current_player_id == self.my_player_id:
-                    self.gameplay_widget.status_label.setText(f" Your Turn! ({self.my_symbol})")
-                    self.gameplay_widget.status_label.setStyleSheet(f"""
-                        background-color: {COLOR_SUCCESS};
-                        color: white;
-                        font-size: 16pt;
-                        font-weight: 700;
-                        padding: 18px;
-                        border-radius: 12px;
-                        border: 3px solid {COLOR_SUCCESS};
-                    """)
-                    self.gameplay_widget.board_widget.set_enabled(True)
+                    self.gameplay_widget.set_status("your_turn", f" Your Turn! ({self.my_symbol})")
+                    self._set_board_enabled(True)
                 else:
-                    self.gameplay_widget.status_label.setText(
+                    self.gameplay_widget.set_status(
+                        "other_turn",
                         f"Waiting for {current_player['name']} ({current_player['symbol']})"
                     )
-                    self.gameplay_widget.status_label.setStyleSheet(f"""
-                        background-color: {COLOR_BG_SECONDARY};
-                        color: {COLOR_TEXT};
-                        font-size: 15pt;
-                        font-weight: 600;
-                        padding: 18px;
-                        border-radius: 12px;
-                        border: 2px solid {COLOR_PRIMARY};
-                    """)
-                    self.gameplay_widget.board_widget.set_enabled(False)
+                    self._set_board_enabled(False)
+    
+    def _set_board_enabled(self, enabled: bool):
+        """Enable or disable the board, skipping redundant updates."""
+        if self._board_enabled is not enabled:
+            self.gameplay_widget.board_widget.set_enabled(enabled)
+            self._board_enabled = enabled
     
     def _handle_game_over(self, data: Dict):
         """Handle GAME_OVER message and automatically exit."""
-        self.gameplay_widget.board_widget.set_enabled(False)
+        if self.gameplay_widget is None or self.gameplay_widget.board_widget is None:
+            return
+        self._set_board_enabled(False)
         
         abandoned = data.get('abandoned', False)
         is_draw = data.get('is_draw', False)
         
         if abandoned:
             reason = data.get('reason', 'Game abandoned')
-            self.gameplay_widget.status_label.setText(" Game Ended")
-            self.gameplay_widget.status_label.setStyleSheet(f"""
-                background-color: {COLOR_WARNING};
-                color: white;
-                font-size: 16pt;
-                font-weight: 700;
-                padding: 18px;
-                border-radius: 12px;
-                border: 3px solid {COLOR_WARNING};
-            """)
+            self.gameplay_widget.set_status("ended", " Game Ended")
             QMessageBox.information(self, "Game Ended", f"{reason}")
         elif is_draw:
-            self.gameplay_widget.status_label.setText(" It's a Draw!")
-            self.gameplay_widget.status_label.setStyleSheet(f"""
-                background-color: {COLOR_WARNING};
-                color: white;
-                font-size: 16pt;
-                font-weight: 700;
-                padding: 18px;
-                border-radius: 12px;
-                border: 3px solid {COLOR_WARNING};
-            """)
+            self.gameplay_widget.set_status("ended", " It's a Draw!")
             QMessageBox.information(self, "Game Over", "The game ended in a draw! ")
         else:
             winner = data.get('winner', {})
@@ -1058,28 +1284,10 @@ class MainWindow(QMainWindow):
             winner_symbol = winner.get('symbol', '?')
             
             if winner.get('player_id') == self.my_player_id:
-                self.gameplay_widget.status_label.setText("🏆 You Won!")
-                self.gameplay_widget.status_label.setStyleSheet(f"""
-                    background-color: {COLOR_SUCCESS};
-                    color: white;
-                    font-size: 18pt;
-                    font-weight: 700;
-                    padding: 18px;
-                    border-radius: 12px;
-                    border: 4px solid {COLOR_SUCCESS};
-                """)
+                self.gameplay_widget.set_status("win", "🏆 You Won!")
                 QMessageBox.information(self, "🏆 Victory!", f"Congratulations! You won! ")
             else:
-                self.gameplay_widget.status_label.setText(f"{winner_name} Won!")
-                self.gameplay_widget.status_label.setStyleSheet(f"""
-                    background-color: {COLOR_DANGER};
-                    color: white;
-                    font-size: 16pt;
-                    font-weight: 700;
-                    padding: 18px;
-                    border-radius: 12px;
-                    border: 3px solid {COLOR_DANGER};
-                """)
+                self.gameplay_widget.set_status("lose", f"{winner_name} Won!")
                 QMessageBox.information(self, "Game Over", f"{winner_name} ({winner_symbol}) won the game!")
         
         QTimer.singleShot(2000, self._auto_return_to_home)
@@ -1092,13 +1300,14 @@ class MainWindow(QMainWindow):
         self.current_game_id = None
         self.my_player_id = None
         self.my_symbol = None
+        self.game_state = None
         
         self._show_home()
     
     def _handle_error(self, data: Dict):
         """Handle ERROR message."""
         error_msg = data.get('message', 'Unknown error')
-        QMessageBox.warning(self, "Error", error_msg)
+        self._show_error("Error", error_msg)
     
     @pyqtSlot()
     def _on_create_game(self):
@@ -1116,7 +1325,7 @@ class MainWindow(QMainWindow):
         game_id = selected_items[0].data(Qt.UserRole)
         if not game_id:
             return
-            
+        
         player_name = self.user_profile.get('name', 'Player')
         self.client.join_game(game_id, player_name)
     
@@ -1145,6 +1354,7 @@ class MainWindow(QMainWindow):
             self.current_game_id = None
             self.my_player_id = None
             self.my_symbol = None
+            self.game_state = None
             self._show_home()
     
     @pyqtSlot(int, int)
@@ -1155,6 +1365,8 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event."""
+        if self._save_timer.isActive():
+            self._flush_profile()
         if self.client.is_connected():
             self.client.disconnect()
         event.accept()
\ No newline at end of file
@@ -5,11 +5,17 @@ Network Client module - handles communication with the server.
 import socket
 import threading
 import logging
+from collections import OrderedDict
 from typing import Optional, Callable, Dict, Any
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QSocketNotifier, pyqtSignal
 from tictactoe_online.common.protocol import Protocol, MessageType
 
 
+# The GUI client keeps network logging quiet without touching the root logger
+logger = logging.getLogger("NetworkClient")
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
 
 class NetworkClient(QObject):
     """
@@ -19,22 +25,34 @@ class NetworkClient(QObject):
         message_received: Emitted when a message is received (msg_type, data)
         connection_lost: Emitted when connection is lost
         connected: Emitted when connected successfully
+        connect_finished: Emitted when connect_async completes (success, error_message)
     """
     
     message_received = pyqtSignal(str, dict)  # msg_type, data
     connection_lost = pyqtSignal()
     connected = pyqtSignal()
+    connect_finished = pyqtSignal(bool, str)  # success, error_message
+    
+    # Internal: the socket is connected and should be watched by the event loop.
+    # Queued automatically when connect() runs on a worker thread.
+    _socket_ready = pyqtSignal()
+    
+    DECODE_CACHE_SIZE = 64
     
     def __init__(self):
         """Initialize the network client."""
         super().__init__()
         self.socket: Optional[socket.socket] = None
         self.running = False
-        self.receive_thread: Optional[threading.Thread] = None
-        self.buffer = b''
-        self.logger = logging.getLogger("NetworkClient")
+        self.read_notifier: Optional[QSocketNotifier] = None
+        self.buffer = bytearray()
+        self._recv_buf = bytearray(65536)  # reused for every recv_into
+        self._recv_mv = memoryview(self._recv_buf)
+        self._decode_cache: OrderedDict = OrderedDict()  # raw bytes -> decoded message
+        self.logger = logger
         self.host: Optional[str] = None
         self.port: Optional[int] = None
+        self._socket_ready.connect(self._start_reading)
     
     def connect(self, host: str, port: int) -> tuple[bool, Optional[str]]:
         """
@@ -49,17 +67,20 @@ class NetworkClient(QObject):
         """
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Small, latency-sensitive frames: send immediately, receive in bulk
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 16)
             self.socket.settimeout(5.0)  # 5 second timeout for connection
             self.socket.connect((host, port))
             self.socket.settimeout(None)  # Remove timeout after connection
             
             self.host = host
             self.port = port
+            self.buffer.clear()
             self.running = True
             
-            # Start receive thread
-            self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
-            self.receive_thread.start()
+            # Hand the socket to the Qt event loop for reading
+            self._socket_ready.emit()
             
             self.logger.info(f"Connected to server at {host}:{port}")
             self.connected.emit()
@@ -73,32 +94,107 @@ class NetworkClient(QObject):
         except Exception as e:
             return False, f"Connection error: {e}"
     
-    def _receive_loop(self):
-        """Main loop for receiving messages from server."""
-        try:
-            while self.running:
-                # Receive data
-                data = self.socket.recv(4096)
-                if not data:
-                    self.logger.info("Server closed connection")
-                    break
-                
-                # Add to buffer
-                self.buffer += data
-                
-                # Process complete messages (delimited by newline)
-                while Protocol.DELIMITER in self.buffer:
-                    message_bytes, self.buffer = self.buffer.split(Protocol.DELIMITER, 1)
-                    self._process_message(message_bytes)
+    def connect_async(self, host: str, port: int):
+        """
+        Connect to the server on a background thread.
+        
+        The result is reported through the connect_finished signal.
+        
+        Args:
+            host: Server hostname or IP
+            port: Server port
+        """
+        def worker():
+            success, error = self.connect(host, port)
+            self.connect_finished.emit(success, error or "")
         
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _start_reading(self):
+        """Watch the socket for incoming data from the Qt event loop."""
+        if not self.running or not self.socket:
+            return
+        self.read_notifier = QSocketNotifier(self.socket.fileno(), QSocketNotifier.Read, self)
+        self.read_notifier.activated.connect(self._on_ready_read)
+    
+    def _stop_reading(self):
+        """Stop watching the socket."""
+        if self.read_notifier:
+            self.read_notifier.setEnabled(False)
+            self.read_notifier.deleteLater()
+            self.read_notifier = None
+    
+    def _on_ready_read(self):
+        """Read the data the socket has ready and process complete messages."""
+        try:
+            # The notifier fires again while data remains, so a single recv
+            # per activation never blocks
+            n = self.socket.recv_into(self._recv_mv)
         except ConnectionResetError:
             self.logger.warning("Connection reset by server")
+            self._on_closed()
+            return
         except Exception as e:
             if self.running:
-                self.logger.error(f"Error in receive loop: {e}")
+                self.logger.error(f"Error receiving data: {e}")
+            self._on_closed()
+            return
+        
+        if not n:
+            self.logger.info("Server closed connection")
+            self._on_closed()
+            return
+        
+        delimiter = Protocol.DELIMITER
+        delimiter_len = len(delimiter)
+        
+        # Add to buffer in place
+        buffer = self.buffer
+        buffer.extend(self._recv_mv[:n])
+        
+        # Handlers may open modal dialogs, whose nested event loop would
+        # re-enter this method; keep the notifier off while dispatching
+        notifier = self.read_notifier
+        if notifier:
+            notifier.setEnabled(False)
+        try:
+            # Process complete messages (delimited by newline), removing
+            # each frame from the buffer before it is handled
+            idx = buffer.find(delimiter)
+            while idx != -1:
+                frame = bytes(buffer[:idx])
+                del buffer[:idx + delimiter_len]
+                self._process_message(frame)
+                if self.read_notifier is not notifier:
+                    break  # Disconnected while handling the message
+                idx = buffer.find(delimiter)
         finally:
-            self.disconnect()
-            self.connection_lost.emit()
+            if notifier and self.read_notifier is notifier:
+                notifier.setEnabled(True)
+    
+    def _on_closed(self):
+        """Tear down after the server side went away."""
+        self.disconnect()
+        self.connection_lost.emit()
+    
+    @staticmethod
+    def _prepare_message(message: Dict[str, Any]):
+        """
+        Precompute display data once per decoded payload.
+        
+        The result is stored with the message in the decode cache, so a
+        repeated GAME_STATE is formatted only once.
+        
+        Args:
+            message: Decoded message, annotated in place
+        """
+        if message.get('type') != MessageType.GAME_STATE.value:
+            return
+        data = message.get('data') or {}
+        data['_players_text'] = "  •  ".join([
+            f"{p['symbol']} {p['name']}" + (" (left)" if not p['is_active'] else "")
+            for p in data.get('players', [])
+        ])
     
     def _process_message(self, message_bytes: bytes):
         """
@@ -107,7 +203,16 @@ class NetworkClient(QObject):
         Args:
             message_bytes: Raw message bytes
         """
-        message = Protocol.decode_message(message_bytes)
+        message = self._decode_cache.get(message_bytes)
+        if message is not None:
+            self._decode_cache.move_to_end(message_bytes)
+        else:
+            message = Protocol.decode_message(message_bytes)
+            if message:
+                self._prepare_message(message)
+                self._decode_cache[message_bytes] = message
+                if len(self._decode_cache) > self.DECODE_CACHE_SIZE:
+                    self._decode_cache.popitem(last=False)
         if not message:
             self.logger.warning("Received invalid message")
             return
@@ -117,7 +222,7 @@ class NetworkClient(QObject):
         
         self.logger.debug(f"Received message: {msg_type}")
         
-        # Emit signal for message handling in GUI thread
+        # Emit signal for message handling (already on the GUI thread)
         self.message_received.emit(msg_type, msg_data)
     
     def send_message(self, msg_type: MessageType, data: Optional[Dict[str, Any]] = None) -> bool:
@@ -175,6 +280,7 @@ class NetworkClient(QObject):
             return
         
         self.running = False
+        self._stop_reading()
         
         # Send disconnect message
         try:
@@ -3,7 +3,7 @@ Board module - represents the Tic-Tac-Toe game board.
 """
 
 from typing import Optional, List, Tuple
-import copy
+import sys
 
 
 class Board:
@@ -18,6 +18,7 @@ class Board:
         size: Size of the board (num_players + 1)
         grid: 2D list representing the board state
         win_length: Number of symbols needed in a row to win (equals num_players)
+        masks: Bitboard per symbol, bit (row * size + col) set for each owned cell
     """
     
     def __init__(self, num_players: int):
@@ -35,6 +36,52 @@ class Board:
         self.win_length = num_players + 1  # Win length equals number of players!
         self.grid = [[None for _ in range(self.size)] for _ in range(self.size)]
         self.move_count = 0
+        self.masks: dict = {}
+        self._static_header = {
+            'num_players': self.num_players,
+            'size': self.size,
+            'win_length': self.win_length
+        }
+        self._win_checks = self._build_win_checks()
+    
+    def _build_win_checks(self) -> List[Tuple[Tuple[int, ...], int]]:
+        """
+        Precompute (shifts, start_mask) pairs for the four line directions.
+        
+        The shifts double the run length covered on each step (1, 2, 4, ...
+        cells) with one final overlapping step to reach win_length, so a win
+        check takes about log2(win_length) AND rounds per direction. A start
+        mask holds the cells from which a full line of win_length fits on the
+        board, so shifted bits never wrap across rows.
+        
+        Returns:
+            List of (bit shifts, legal start mask) tuples
+        """
+        size, span = self.size, self.win_length - 1
+        directions = [
+            (1, lambda r, c: c + span < size),                       # Horizontal
+            (size, lambda r, c: r + span < size),                    # Vertical
+            (size + 1, lambda r, c: r + span < size and c + span < size),  # Diagonal
+            (size - 1, lambda r, c: r + span < size and c - span >= 0)     # Anti-diagonal
+        ]
+        # Run lengths covered after each round: 1 -> 2 -> 4 ... -> win_length
+        steps = []
+        run = 1
+        while run * 2 <= self.win_length:
+            steps.append(run)
+            run *= 2
+        if run < self.win_length:
+            steps.append(self.win_length - run)
+        
+        checks = []
+        for shift, fits in directions:
+            start_mask = 0
+            for r in range(size):
+                for c in range(size):
+                    if fits(r, c):
+                        start_mask |= 1 << (r * size + c)
+            checks.append((tuple(step * shift for step in steps), start_mask))
+        return checks
     
     def is_valid_move(self, row: int, col: int) -> bool:
         """
@@ -66,7 +113,10 @@ class Board:
         if not self.is_valid_move(row, col):
             return False
         
+        # Interned so grid cells and mask keys share one object per symbol
+        symbol = sys.intern(symbol)
         self.grid[row][col] = symbol
+        self.masks[symbol] = self.masks.get(symbol, 0) | (1 << (row * self.size + col))
         self.move_count += 1
         return True
     
@@ -85,33 +135,14 @@ class Board:
         if symbol is None:
             return None
         
-        # Check all four directions: horizontal, vertical, diagonal, anti-diagonal
-        directions = [
-            (0, 1),   # Horizontal
-            (1, 0),   # Vertical
-            (1, 1),   # Diagonal
-            (1, -1)   # Anti-diagonal
-        ]
-        
-        for dr, dc in directions:
-            count = 1  # Count the current cell
-            
-            # Check in positive direction
-            r, c = row + dr, col + dc
-            while 0 <= r < self.size and 0 <= c < self.size and self.grid[r][c] == symbol:
-                count += 1
-                r += dr
-                c += dc
-            
-            # Check in negative direction
-            r, c = row - dr, col - dc
-            while 0 <= r < self.size and 0 <= c < self.size and self.grid[r][c] == symbol:
-                count += 1
-                r -= dr
-                c -= dc
-            
-            # Win requires exactly num_players symbols in a row
-            if count >= self.win_length:
+        # AND the bitboard with itself shifted along each direction; a bit
+        # surviving all precomputed rounds marks the start of a full line
+        mask = self.masks.get(symbol, 0)
+        for shifts, start_mask in self._win_checks:
+            lines = mask
+            for shift in shifts:
+                lines &= lines >> shift
+            if lines & start_mask:
                 return symbol
         
         return None
@@ -130,21 +161,22 @@ class Board:
         Get the current board state.
         
         Returns:
-            Deep copy of the board grid
+            Copy of the board grid (cells are immutable, so copying rows suffices)
         """
-        return copy.deepcopy(self.grid)
+        return [row[:] for row in self.grid]
     
     def to_dict(self) -> dict:
         """
         Convert board to dictionary for serialization.
         
+        The grid is returned as-is (not copied); it only holds immutable
+        cells and is only read by the encoder.
+        
         Returns:
             Dictionary representation of board
         """
         return {
-            'num_players': self.num_players,
-            'size': self.size,
-            'win_length': self.win_length,
+            **self._static_header,
             'grid': self.grid,
             'move_count': self.move_count
         }
@@ -163,6 +195,10 @@ class Board:
         board = Board(data['num_players'])
         board.grid = data['grid']
         board.move_count = data['move_count']
+        for r, row in enumerate(board.grid):
+            for c, symbol in enumerate(row):
+                if symbol is not None:
+                    board.masks[symbol] = board.masks.get(symbol, 0) | (1 << (r * board.size + c))
         return board
     
     def __repr__(self) -> str:
@@ -3,10 +3,12 @@ Game module - represents a game room/session.
 """
 
 from typing import List, Optional, Dict, Tuple
+from collections import deque
 from enum import Enum
 import uuid
 from .board import Board
 from .player import Player
+from .protocol import Protocol, MessageType
 
 
 class GameState(Enum):
@@ -41,11 +43,15 @@ class Game:
         self.game_id = game_id or str(uuid.uuid4())[:8]
         self.num_players = num_players
         self.players: List[Player] = []
+        self._players_by_id: Dict[str, Player] = {}  # Same players, keyed for lookup
         self.board = Board(num_players)
         self.current_player_index = 0
+        self._active_order: deque = deque()  # Active player indices, current first
         self.state = GameState.WAITING
         self.winner: Optional[Player] = None
         self.is_draw = False
+        self._static_header = {'game_id': self.game_id, 'num_players': self.num_players}
+        self._state_frame: Optional[bytes] = None  # Encoded GAME_STATE, reset on any change
     
     def add_player(self, player: Player) -> bool:
         """
@@ -60,10 +66,13 @@ class Game:
         if len(self.players) >= self.num_players:
             return False
         
-        if player in self.players:
+        if player.player_id in self._players_by_id:
             return False
         
         self.players.append(player)
+        self._players_by_id[player.player_id] = player
+        self._rebuild_active_order()
+        self._state_frame = None
         
         # Start game when all players have joined
         if len(self.players) == self.num_players:
@@ -81,10 +90,12 @@ class Game:
         Returns:
             True if player removed successfully, False otherwise
         """
-        if player not in self.players:
+        if player.player_id not in self._players_by_id:
             return False
         
         player.is_active = False
+        self._rebuild_active_order()
+        self._state_frame = None
         
         # If game was in progress, end it
         if self.state == GameState.PLAYING:
@@ -92,6 +103,29 @@ class Game:
         
         return True
     
+    def get_player(self, player_id: str) -> Optional[Player]:
+        """
+        Get a player in this game by ID.
+        
+        Args:
+            player_id: Player identifier
+            
+        Returns:
+            Player or None if not in this game
+        """
+        return self._players_by_id.get(player_id)
+    
+    def _rebuild_active_order(self):
+        """Recompute the turn order of active players, starting at the current index."""
+        count = len(self.players)
+        start = self.current_player_index
+        self._active_order = deque(
+            i % count for i in range(start, start + count)
+            if self.players[i % count].is_active
+        )
+        if self._active_order:
+            self.current_player_index = self._active_order[0]
+    
     def get_current_player(self) -> Optional[Player]:
         """
         Get the current player whose turn it is.
@@ -99,19 +133,11 @@ class Game:
         Returns:
             Current player or None if game not started
         """
-        if self.state != GameState.PLAYING:
+        if self.state != GameState.PLAYING or not self._active_order:
             return None
         
-        # Skip inactive players
-        attempts = 0
-        while attempts < len(self.players):
-            player = self.players[self.current_player_index]
-            if player.is_active:
-                return player
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
-            attempts += 1
-        
-        return None
+        # Inactive players are never in the turn order
+        return self.players[self._active_order[0]]
     
     def make_move(self, player: Player, row: int, col: int) -> Tuple[bool, Optional[str]]:
         """
@@ -137,6 +163,7 @@ class Game:
         # Validate and make the move
         if not self.board.make_move(row, col, player.symbol):
             return False, "Invalid move"
+        self._state_frame = None
         
         # Check for winner
         winner_symbol = self.board.check_winner(row, col)
@@ -152,7 +179,8 @@ class Game:
             return True, None
         
         # Move to next player
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self._active_order.rotate(-1)
+        self.current_player_index = self._active_order[0]
         
         return True, None
     
@@ -185,8 +213,7 @@ class Game:
             Dictionary representation of game
         """
         data = {
-            'game_id': self.game_id,
-            'num_players': self.num_players,
+            **self._static_header,
             'current_player_count': len(self.players),
             'state': self.state.value,
             'is_draw': self.is_draw
@@ -206,6 +233,22 @@ class Game:
         
         return data
     
+    def state_frame(self) -> bytes:
+        """
+        Get the encoded GAME_STATE message for this game.
+        
+        The frame is cached until the next join, leave or move, so
+        repeated broadcasts of the same state are encoded once.
+        
+        Returns:
+            Encoded GAME_STATE frame
+        """
+        if self._state_frame is None:
+            self._state_frame = Protocol.encode_message(
+                MessageType.GAME_STATE, self.to_dict(include_board=True)
+            )
+        return self._state_frame
+    
     def __repr__(self) -> str:
         return (f"Game(id={self.game_id}, players={len(self.players)}/{self.num_players}, "
                 f"state={self.state.value})")
\ No newline at end of file
@@ -2,6 +2,7 @@
 Player module - represents a player in the game.
 """
 
+import sys
 from typing import Optional
 
 
@@ -16,8 +17,8 @@ class Player:
         socket: Network socket for communication (server-side only)
     """
     
-    # Available symbols for players
-    SYMBOLS = ['X', 'O', 'Δ', '□', '◇', '★', '♠', '♣', '♥', '♦']
+    # Available symbols for players, interned to match Board's interned keys
+    SYMBOLS = [sys.intern(s) for s in ('X', 'O', 'Δ', '□', '◇', '★', '♠', '♣', '♥', '♦')]
     
     def __init__(self, player_id: str, name: str, symbol: str, socket=None):
         """
@@ -30,24 +31,41 @@ class Player:
             socket: Network socket (optional, server-side only)
         """
         self.player_id = player_id
+        self._hash = hash(player_id)
         self.name = name
         self.symbol = symbol
         self.socket = socket
-        self.is_active = True
+        self._is_active = True
+        self._dict_cache: Optional[dict] = None
+    
+    @property
+    def is_active(self) -> bool:
+        """Whether the player is still in the game."""
+        return self._is_active
+    
+    @is_active.setter
+    def is_active(self, value: bool):
+        self._is_active = value
+        self._dict_cache = None
     
     def to_dict(self) -> dict:
         """
         Convert player to dictionary for serialization.
         
+        The dictionary is cached until is_active changes; callers must
+        treat it as read-only.
+        
         Returns:
             Dictionary representation of player
         """
-        return {
-            'player_id': self.player_id,
-            'name': self.name,
-            'symbol': self.symbol,
-            'is_active': self.is_active
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'player_id': self.player_id,
+                'name': self.name,
+                'symbol': self.symbol,
+                'is_active': self._is_active
+            }
+        return self._dict_cache
     
     @staticmethod
     def from_dict(data: dict) -> 'Player':
@@ -72,9 +90,12 @@ class Player:
         return f"Player(id={self.player_id}, name={self.name}, symbol={self.symbol})"
     
     def __eq__(self, other) -> bool:
+        # Each player is normally a single object, so identity settles most comparisons
+        if other is self:
+            return True
         if not isinstance(other, Player):
             return False
-        return self.player_id == other.player_id
+        return self._hash == other._hash and self.player_id == other.player_id
     
     def __hash__(self) -> int:
-        return hash(self.player_id)
\ No newline at end of file
+        return self._hash
\ No newline at end of file
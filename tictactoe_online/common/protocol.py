@@ -7,6 +7,20 @@ import json
 from enum import Enum
 from typing import Dict, Any, Optional, List
 
+# orjson is optional; it is used for encoding/decoding when installed.
+# Both backends work on bytes end to end (no intermediate str).
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    _loads = json.loads
+
 
 class MessageType(Enum):
     """Enumeration of all message types in the protocol."""
@@ -36,6 +50,15 @@ class Protocol:
     DELIMITER = b'\n'
     ENCODING = 'utf-8'
     
+    # Pre-encoded frames for messages without data (filled in below the class)
+    _STATIC_FRAMES: Dict[MessageType, bytes] = {}
+    
+    # Wire value -> MessageType, cheaper than MessageType(value) per message
+    MESSAGE_TYPES: Dict[str, MessageType] = {}
+    
+    # Encoded ERROR frames for the fixed set of error strings, built on first use
+    _ERROR_FRAMES: Dict[str, bytes] = {}
+    
     @staticmethod
     def encode_message(msg_type: MessageType, data: Optional[Dict[str, Any]] = None) -> bytes:
         """
@@ -48,12 +71,15 @@ class Protocol:
         Returns:
             Encoded message as bytes
         """
+        if not data:
+            static_frame = Protocol._STATIC_FRAMES.get(msg_type)
+            if static_frame is not None:
+                return static_frame
         message = {
-            'type': msg_type.value,
+            'type': _TYPE_VALUES[msg_type],
             'data': data or {}
         }
-        json_str = json.dumps(message)
-        return (json_str + '\n').encode(Protocol.ENCODING)
+        return _dumps(message) + Protocol.DELIMITER
     
     @staticmethod
     def decode_message(data: bytes) -> Optional[Dict[str, Any]]:
@@ -66,13 +92,37 @@ class Protocol:
         Returns:
             Decoded message dictionary or None if invalid
         """
+        # Frames arrive already split on the delimiter; an empty one (a
+        # stray blank line) is rejected without raising
+        if not data:
+            return None
         try:
-            json_str = data.decode(Protocol.ENCODING).strip()
-            return json.loads(json_str)
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # Both backends accept bytes and surrounding whitespace
+            return _loads(data)
+        except ValueError as e:  # Also covers JSONDecodeError and UnicodeDecodeError
             print(f"Error decoding message: {e}")
             return None
     
+    @staticmethod
+    def error_frame(message: str, cache: bool = True) -> bytes:
+        """
+        Encode an ERROR message.
+        
+        Args:
+            message: Error text
+            cache: Whether to keep the frame for reuse; pass False for
+                arbitrary text (e.g. exception messages)
+            
+        Returns:
+            Encoded ERROR frame
+        """
+        frame = Protocol._ERROR_FRAMES.get(message)
+        if frame is None:
+            frame = Protocol.encode_message(MessageType.ERROR, {'message': message})
+            if cache:
+                Protocol._ERROR_FRAMES[message] = frame
+        return frame
+    
     @staticmethod
     def create_game_request(num_players: int) -> bytes:
         """Create a CREATE_GAME request."""
@@ -92,7 +142,7 @@ class Protocol:
     @staticmethod
     def list_games_request() -> bytes:
         """Create a LIST_GAMES request."""
-        return Protocol.encode_message(MessageType.LIST_GAMES)
+        return Protocol._STATIC_FRAMES[MessageType.LIST_GAMES]
     
     @staticmethod
     def make_move_request(row: int, col: int) -> bytes:
@@ -105,12 +155,23 @@ class Protocol:
     @staticmethod
     def quit_game_request() -> bytes:
         """Create a QUIT_GAME request."""
-        return Protocol.encode_message(MessageType.QUIT_GAME)
+        return Protocol._STATIC_FRAMES[MessageType.QUIT_GAME]
     
     @staticmethod
     def disconnect_request() -> bytes:
         """Create a DISCONNECT request."""
-        return Protocol.encode_message(MessageType.DISCONNECT)
+        return Protocol._STATIC_FRAMES[MessageType.DISCONNECT]
+
+
+# Enum values looked up once instead of via .value on every encode
+_TYPE_VALUES = {mt: mt.value for mt in MessageType}
+Protocol.MESSAGE_TYPES.update({value: mt for mt, value in _TYPE_VALUES.items()})
+
+# Every message type encodes to a fixed frame when it carries no data
+Protocol._STATIC_FRAMES.update({
+    mt: _dumps({'type': mt.value, 'data': {}}) + Protocol.DELIMITER
+    for mt in MessageType
+})
 
 
 # GAME_OVER message can include these fields:
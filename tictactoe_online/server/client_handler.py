@@ -2,80 +2,167 @@
 Client Handler module - manages individual client connections.
 """
 
-import socket
-import threading
+import asyncio
 import logging
-from typing import Optional, Callable, Dict, Any
+import socket
+from typing import Optional, Callable, Dict, Any, List
 from common.protocol import Protocol, MessageType
 
+# One logger shared by all handlers; each handler tags records with its player ID
+log = logging.getLogger("ClientHandler")
+
+# Linux only; re-armed after every read because the kernel clears it
+_TCP_QUICKACK = getattr(socket, 'TCP_QUICKACK', None)
+
+# Unsent bytes a client that stopped reading may accumulate before it is dropped
+MAX_WRITE_BACKLOG = 1 << 20
+
+# Largest client message accepted; requests are tiny, so anything bigger
+# is refused rather than parsed on the event loop
+MAX_MESSAGE_SIZE = 64 * 1024
+
+# Every GAME_STATE frame starts with this (encode_message writes 'type' first);
+# a newer one supersedes any still waiting to be written
+_STATE_FRAME_PREFIX = b'{"type":"' + MessageType.GAME_STATE.value.encode() + b'"'
+
+
+class _PlayerLogAdapter(logging.LoggerAdapter):
+    """Prefix log messages with the player ID and expose it as record.player_id."""
+    
+    def process(self, msg, kwargs):
+        kwargs['extra'] = self.extra
+        return f"[{self.extra['player_id']}] {msg}", kwargs
+
 
-class ClientHandler:
+class ClientHandler(asyncio.BufferedProtocol):
     """
     Handles communication with a single client.
     
+    Runs as an asyncio protocol on the server's event loop: the loop reads
+    straight into a reusable buffer and calls buffer_updated, so no thread
+    is spent per client.
+    
     Attributes:
-        client_socket: Socket connected to the client
+        transport: Transport connected to the client
         client_address: Address of the client
         player_id: Unique identifier for this client
         current_game_id: ID of game this client is in
-        message_callback: Callback for processing messages
+        on_message: Callback for processing messages
+        on_disconnect: Callback run once when the connection ends
     """
     
     def __init__(self, 
-                 client_socket: socket.socket,
-                 client_address: tuple,
                  player_id: str,
-                 message_callback: Callable[[str, Dict[str, Any]], None]):
+                 on_message: Callable[[str, MessageType, Dict[str, Any]], None],
+                 on_disconnect: Callable[[str], None]):
         """
         Initialize client handler.
         
         Args:
-            client_socket: Connected socket
-            client_address: Client's address
             player_id: Unique player identifier
-            message_callback: Function to call when message received
+            on_message: Function to call when message received
+            on_disconnect: Function to call when the client disconnects
         """
-        self.client_socket = client_socket
-        self.client_address = client_address
+        self.transport: Optional[asyncio.Transport] = None
+        self.client_address: Optional[tuple] = None
         self.player_id = player_id
         self.current_game_id: Optional[str] = None
-        self.message_callback = message_callback
+        self.on_message = on_message
+        self.on_disconnect = on_disconnect
         self.running = False
-        self.receive_thread: Optional[threading.Thread] = None
-        self.buffer = b''
-        self.logger = logging.getLogger(f"ClientHandler-{player_id}")
+        self.buffer = bytearray()
+        self._scan_pos = 0  # Buffer prefix already known to hold no delimiter
+        self._rxbuf = bytearray(65536)  # Reused for every read
+        self._rxview = memoryview(self._rxbuf)
+        self._sock = None  # Underlying socket, for per-read socket options
+        self._write_paused = False  # Transport buffer above its high-water mark
+        self._pending: List[bytes] = []  # Frames queued during this loop iteration
+        self._pending_size = 0
+        self._flush_scheduled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.logger = _PlayerLogAdapter(log, {'player_id': player_id})
     
-    def start(self):
+    def connection_made(self, transport: asyncio.Transport):
         """Start handling the client connection."""
+        self.transport = transport
+        self.client_address = transport.get_extra_info('peername')
+        self._loop = asyncio.get_running_loop()
+        
+        # Small latency-sensitive frames: no Nagle, keepalive to detect
+        # dead peers (asyncio creates the socket non-blocking and CLOEXEC)
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                if _TCP_QUICKACK is not None:
+                    self._sock = sock
+            except OSError as e:
+                self.logger.warning("Could not set socket options: %s", e)
+        
         self.running = True
-        self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
-        self.receive_thread.start()
-        self.logger.info(f"Started handling client {self.client_address}")
+        self.logger.info("Started handling client %s", self.client_address)
     
-    def _receive_loop(self):
-        """Main loop for receiving messages from client."""
-        try:
-            while self.running:
-                # Receive data
-                data = self.client_socket.recv(4096)
-                if not data:
-                    self.logger.info(f"Client {self.client_address} disconnected")
-                    break
-                
-                # Add to buffer
-                self.buffer += data
-                
-                # Process complete messages (delimited by newline)
-                while Protocol.DELIMITER in self.buffer:
-                    message_bytes, self.buffer = self.buffer.split(Protocol.DELIMITER, 1)
-                    self._process_message(message_bytes)
-        
-        except ConnectionResetError:
-            self.logger.warning(f"Connection reset by client {self.client_address}")
-        except Exception as e:
-            self.logger.error(f"Error in receive loop: {e}")
-        finally:
-            self.stop()
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Hand the event loop the reusable receive buffer."""
+        return self._rxview
+    
+    def buffer_updated(self, nbytes: int):
+        """
+        Append newly received bytes and process complete messages.
+        
+        Args:
+            nbytes: Number of bytes written into the receive buffer
+        """
+        delimiter = Protocol.DELIMITER
+        delimiter_len = len(delimiter)
+        
+        # Acknowledge immediately instead of waiting for delayed ACK
+        if self._sock is not None:
+            try:
+                self._sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            except OSError:
+                self._sock = None
+        
+        # Add to buffer in place
+        buffer = self.buffer
+        buffer.extend(self._rxview[:nbytes])
+        
+        # Process complete messages (delimited by newline), scanning only
+        # bytes not looked at before
+        start = 0
+        idx = buffer.find(delimiter, self._scan_pos)
+        while idx != -1:
+            if idx - start > MAX_MESSAGE_SIZE:
+                self.logger.warning("Ignoring oversized message (%s bytes)", idx - start)
+            else:
+                self._process_message(bytes(memoryview(buffer)[start:idx]))
+            start = idx + delimiter_len
+            idx = buffer.find(delimiter, start)
+        if start:
+            del buffer[:start]
+        self._scan_pos = len(buffer)
+        
+        # A partial message can only grow; stop buffering it once too large
+        if self._scan_pos > MAX_MESSAGE_SIZE:
+            self.logger.warning("Dropping client %s: message exceeds %s bytes",
+                                self.client_address, MAX_MESSAGE_SIZE)
+            buffer.clear()
+            self._scan_pos = 0
+            self.transport.abort()
+    
+    def eof_received(self) -> bool:
+        """Handle the client closing its side of the connection."""
+        self.logger.info("Client %s disconnected", self.client_address)
+        return False  # Let the transport close itself
+    
+    def connection_lost(self, exc: Optional[Exception]):
+        """Handle the connection going away."""
+        if isinstance(exc, ConnectionResetError):
+            self.logger.warning("Connection reset by client %s", self.client_address)
+        elif exc is not None:
+            self.logger.error("Connection error: %s", exc)
+        self.stop()
     
     def _process_message(self, message_bytes: bytes):
         """
@@ -85,40 +172,155 @@ class ClientHandler:
             message_bytes: Raw message bytes
         """
         message = Protocol.decode_message(message_bytes)
-        if not message:
+        if not message or not isinstance(message, dict):
             self.logger.warning("Received invalid message")
             return
         
-        msg_type = message.get('type')
+        raw_type = message.get('type')
+        msg_type = Protocol.MESSAGE_TYPES.get(raw_type) if isinstance(raw_type, str) else None
+        if msg_type is None:
+            self.logger.warning("Received unknown message type: %r", raw_type)
+            return
         msg_data = message.get('data', {})
         
-        self.logger.debug(f"Received message: {msg_type}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Received message: %s", msg_type.value)
         
         # Call the callback to process the message
-        if self.message_callback:
+        if self.on_message:
             try:
-                self.message_callback(self.player_id, message)
+                self.on_message(self.player_id, msg_type, msg_data)
             except Exception as e:
-                self.logger.error(f"Error in message callback: {e}")
+                self.logger.error("Error in message callback: %s", e)
     
     def send_message(self, msg_type: MessageType, data: Optional[Dict[str, Any]] = None) -> bool:
         """
         Send a message to the client.
         
+        The frame is queued and written together with any other frames
+        sent to this client in the same event loop iteration.
+        
         Args:
             msg_type: Type of message
             data: Message data
-            
+        
         Returns:
-            True if sent successfully, False otherwise
+            True if queued successfully, False otherwise
         """
+        if not self.transport or self.transport.is_closing():
+            return False
         try:
             message = Protocol.encode_message(msg_type, data)
-            self.client_socket.sendall(message)
-            return True
         except Exception as e:
-            self.logger.error(f"Error sending message: {e}")
+            self.logger.error("Error sending message: %s", e)
             return False
+        self._enqueue((message,))
+        return True
+    
+    def send_frame(self, frame: bytes) -> bool:
+        """
+        Send an already encoded message to the client.
+        
+        Args:
+            frame: Encoded message, including the delimiter
+            
+        Returns:
+            True if queued successfully, False otherwise
+        """
+        if not self.transport or self.transport.is_closing():
+            return False
+        self._enqueue((frame,))
+        return True
+    
+    def send_frames(self, frames: List[bytes]) -> bool:
+        """
+        Send several already encoded messages to the client.
+        
+        Args:
+            frames: Encoded messages, each including the delimiter
+            
+        Returns:
+            True if queued successfully, False otherwise
+        """
+        if not self.transport or self.transport.is_closing():
+            return False
+        self._enqueue(frames)
+        return True
+    
+    def _enqueue(self, frames):
+        """
+        Queue frames to be written once the current callback ends.
+        
+        While the client is not keeping up, frames stay queued here
+        rather than piling into the transport, and a new GAME_STATE
+        replaces queued ones since only the latest state matters. All
+        other frames (e.g. GAME_OVER) are always kept.
+        
+        Args:
+            frames: Encoded messages, each including the delimiter
+        """
+        pending = self._pending
+        if self._write_paused:
+            for frame in frames:
+                if frame.startswith(_STATE_FRAME_PREFIX):
+                    pending = self._pending = [
+                        f for f in pending if not f.startswith(_STATE_FRAME_PREFIX)
+                    ]
+                    self._pending_size = sum(map(len, pending))
+                    break
+        pending.extend(frames)
+        for frame in frames:
+            self._pending_size += len(frame)
+        
+        if self._write_paused:
+            self._check_backlog()
+        elif self._pending_size > MAX_WRITE_BACKLOG:
+            self._flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush)
+    
+    def _flush(self):
+        """Write all queued frames to the transport in a single call."""
+        self._flush_scheduled = False
+        pending = self._pending
+        if not pending or self._write_paused:
+            return
+        self._pending = []
+        self._pending_size = 0
+        if self.transport.is_closing():
+            return
+        self.transport.writelines(pending)
+    
+    def pause_writing(self):
+        """Hold further frames back until the transport drains."""
+        self._write_paused = True
+    
+    def resume_writing(self):
+        """Write the frames held back while the transport was full."""
+        self._write_paused = False
+        if self._pending and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush)
+    
+    def _check_backlog(self) -> bool:
+        """
+        Drop the connection if the client has stopped reading.
+        
+        Sends never wait for the transport to drain, so this bounds the
+        memory a stalled client can tie up instead.
+        
+        Returns:
+            True if the connection is kept, False if it was aborted
+        """
+        backlog = self.transport.get_write_buffer_size() + self._pending_size
+        if backlog <= MAX_WRITE_BACKLOG:
+            return True
+        self.logger.warning("Dropping client %s: %s bytes unsent", self.client_address, backlog)
+        self._pending = []
+        self._pending_size = 0
+        self.transport.abort()
+        return False
     
     def stop(self):
         """Stop handling the client and close connection."""
@@ -128,21 +330,18 @@ class ClientHandler:
         self.running = False
         
         try:
-            self.client_socket.close()
+            self.transport.close()
         except:
             pass
         
         # Notify server that client disconnected
-        if self.message_callback:
+        if self.on_disconnect:
             try:
-                self.message_callback(self.player_id, {
-                    'type': MessageType.DISCONNECT.value,
-                    'data': {}
-                })
+                self.on_disconnect(self.player_id)
             except:
                 pass
         
-        self.logger.info(f"Stopped handling client {self.client_address}")
+        self.logger.info("Stopped handling client %s", self.client_address)
     
     def __repr__(self) -> str:
-        return f"ClientHandler(player_id={self.player_id}, address={self.client_address})"
\ No newline at end of file
+        return f"ClientHandler(player_id={self.player_id}, address={self.client_address})"
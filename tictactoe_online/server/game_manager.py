@@ -3,9 +3,10 @@ Game Manager module - manages all active games on the server.
 """
 
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from common.game import Game, GameState
 from common.player import Player
+from common.protocol import Protocol, MessageType
 
 
 class GameManager:
@@ -14,13 +15,19 @@ class GameManager:
     
     Attributes:
         games: Dictionary mapping game_id to Game objects
-        player_to_game: Dictionary mapping player_id to game_id
+        player_index: Dictionary mapping player_id to its (Game, Player)
     """
     
     def __init__(self):
         """Initialize the game manager."""
         self.games: Dict[str, Game] = {}
-        self.player_to_game: Dict[str, str] = {}
+        self.player_index: Dict[str, Tuple[Game, Player]] = {}
+        self._state_counts: Dict[GameState, int] = {state: 0 for state in GameState}
+        
+        # Lobby listing, rebuilt only after games are created, joined or left
+        self._game_list_dirty = True
+        self._cached_game_list: List[Dict] = []
+        self._cached_game_list_frame: Optional[bytes] = None
         self.logger = logging.getLogger("GameManager")
     
     def create_game(self, num_players: int) -> Game:
@@ -35,7 +42,9 @@ class GameManager:
         """
         game = Game(None, num_players)
         self.games[game.game_id] = game
-        self.logger.info(f"Created game {game.game_id} for {num_players} players")
+        self._state_counts[game.state] += 1
+        self._game_list_dirty = True
+        self.logger.info("Created game %s for %s players", game.game_id, num_players)
         return game
     
     def get_game(self, game_id: str) -> Optional[Game]:
@@ -65,26 +74,28 @@ class GameManager:
         if not game:
             return False, "Game not found"
         
-        if game.state != GameState.WAITING:
+        if game.state is not GameState.WAITING:
             return False, "Game already started"
         
         # Check if player is already in another game
-        if player.player_id in self.player_to_game:
-            old_game_id = self.player_to_game[player.player_id]
-            old_game = self.get_game(old_game_id)
+        entry = self.player_index.get(player.player_id)
+        if entry:
+            old_game = entry[0]
             
             # If old game is finished or doesn't exist, clean it up
-            if not old_game or old_game.state == GameState.FINISHED:
-                del self.player_to_game[player.player_id]
-                self.logger.info(f"Cleaned up player {player.player_id} from finished/missing game")
+            if old_game.game_id not in self.games or old_game.state is GameState.FINISHED:
+                del self.player_index[player.player_id]
+                self.logger.info("Cleaned up player %s from finished/missing game", player.player_id)
             else:
                 return False, "Player already in a game"
         
         if not game.add_player(player):
             return False, "Game is full"
+        self._track_state(game, GameState.WAITING)
+        self._game_list_dirty = True
         
-        self.player_to_game[player.player_id] = game_id
-        self.logger.info(f"Player {player.player_id} joined game {game_id}")
+        self.player_index[player.player_id] = (game, player)
+        self.logger.info("Player %s joined game %s", player.player_id, game_id)
         
         return True, None
     
@@ -98,29 +109,21 @@ class GameManager:
         Returns:
             Game the player left, or None
         """
-        game_id = self.player_to_game.get(player_id)
-        if not game_id:
+        entry = self.player_index.pop(player_id, None)
+        if not entry:
             return None
         
-        game = self.get_game(game_id)
-        if not game:
-            return None
+        # Remove the player
+        game, player = entry
+        old_state = game.state
+        game.remove_player(player)
+        self._track_state(game, old_state)
+        self._game_list_dirty = True
+        self.logger.info("Player %s left game %s", player_id, game.game_id)
         
-        # Find and remove the player
-        player = None
-        for p in game.players:
-            if p.player_id == player_id:
-                player = p
-                break
-        
-        if player:
-            game.remove_player(player)
-            del self.player_to_game[player_id]
-            self.logger.info(f"Player {player_id} left game {game_id}")
-            
-            # Clean up finished games with no active players
-            if game.get_active_player_count() == 0:
-                self._cleanup_game(game_id)
+        # Clean up finished games with no active players
+        if game.get_active_player_count() == 0:
+            self._cleanup_game(game.game_id)
         
         return game
     
@@ -134,23 +137,42 @@ class GameManager:
         Returns:
             Game object or None
         """
-        game_id = self.player_to_game.get(player_id)
-        if game_id:
-            return self.get_game(game_id)
-        return None
+        entry = self.player_index.get(player_id)
+        return entry[0] if entry else None
     
     def list_available_games(self) -> List[Dict]:
         """
         Get list of games that can be joined.
         
+        The list is cached until a game is created, joined, left or
+        removed; callers must treat it as read-only.
+        
         Returns:
             List of game dictionaries
         """
-        available = []
-        for game in self.games.values():
-            if game.state == GameState.WAITING:
-                available.append(game.to_dict(include_board=False))
-        return available
+        if self._game_list_dirty:
+            self._cached_game_list = [
+                game.to_dict(include_board=False)
+                for game in self.games.values()
+                if game.state is GameState.WAITING
+            ]
+            self._cached_game_list_frame = None
+            self._game_list_dirty = False
+        return self._cached_game_list
+    
+    def game_list_frame(self) -> bytes:
+        """
+        Get the encoded GAME_LIST message for the current lobby.
+        
+        Returns:
+            Encoded GAME_LIST frame, reused until the lobby changes
+        """
+        games = self.list_available_games()
+        if self._cached_game_list_frame is None:
+            self._cached_game_list_frame = Protocol.encode_message(
+                MessageType.GAME_LIST, {'games': games}
+            )
+        return self._cached_game_list_frame
     
     def make_move(self, player_id: str, row: int, col: int) -> tuple[bool, Optional[str], Optional[Game]]:
         """
@@ -164,32 +186,46 @@ class GameManager:
         Returns:
             Tuple of (success, error_message, game)
         """
-        game = self.get_player_game(player_id)
-        if not game:
+        entry = self.player_index.get(player_id)
+        if not entry:
             return False, "Not in a game", None
+        game, player = entry
         
-        # Find the player
-        player = None
-        for p in game.players:
-            if p.player_id == player_id:
-                player = p
-                break
-        
-        if not player:
-            return False, "Player not found in game", None
-        
+        old_state = game.state
         success, error = game.make_move(player, row, col)
+        self._track_state(game, old_state)
         
         # Clean up if game is finished
-        if game.state == GameState.FINISHED:
+        if game.state is GameState.FINISHED:
             # Remove all player mappings so they can join new games
-            for p in game.players:
-                if p.player_id in self.player_to_game:
-                    del self.player_to_game[p.player_id]
-            self.logger.info(f"Game {game.game_id} finished - freed all players")
+            self.release_players(game)
+            self.logger.info("Game %s finished - freed all players", game.game_id)
         
         return success, error, game
     
+    def release_players(self, game: Game):
+        """
+        Remove the player mappings of a game so its players can join others.
+        
+        Args:
+            game: Game whose players to release
+        """
+        player_index = self.player_index
+        for player in game.players:
+            player_index.pop(player.player_id, None)
+    
+    def _track_state(self, game: Game, old_state: GameState):
+        """
+        Update the per-state game counters after a possible transition.
+        
+        Args:
+            game: Game that may have changed state
+            old_state: State of the game before the operation
+        """
+        if game.state is not old_state:
+            self._state_counts[old_state] -= 1
+            self._state_counts[game.state] += 1
+    
     def _cleanup_game(self, game_id: str):
         """
         Remove a game from the manager.
@@ -201,13 +237,13 @@ class GameManager:
             game = self.games[game_id]
             
             # Remove all player mappings
-            for player in game.players:
-                if player.player_id in self.player_to_game:
-                    del self.player_to_game[player.player_id]
+            self.release_players(game)
             
             # Remove the game
+            self._state_counts[game.state] -= 1
+            self._game_list_dirty = True
             del self.games[game_id]
-            self.logger.info(f"Cleaned up game {game_id}")
+            self.logger.info("Cleaned up game %s", game_id)
     
     def get_stats(self) -> Dict:
         """
@@ -216,10 +252,11 @@ class GameManager:
         Returns:
             Dictionary with server stats
         """
+        state_counts = self._state_counts
         return {
             'total_games': len(self.games),
-            'waiting_games': sum(1 for g in self.games.values() if g.state == GameState.WAITING),
-            'active_games': sum(1 for g in self.games.values() if g.state == GameState.PLAYING),
-            'finished_games': sum(1 for g in self.games.values() if g.state == GameState.FINISHED),
-            'total_players': len(self.player_to_game)
+            'waiting_games': state_counts[GameState.WAITING],
+            'active_games': state_counts[GameState.PLAYING],
+            'finished_games': state_counts[GameState.FINISHED],
+            'total_players': len(self.player_index)
         }
\ No newline at end of file
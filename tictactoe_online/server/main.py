@@ -3,8 +3,10 @@
 Server main entry point.
 """
 
+import asyncio
 import sys
 import signal
+import logging
 from .server import Server
 
 
@@ -14,6 +16,18 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 
+def _install_uvloop():
+    """Use uvloop for the server's event loop on Linux, if installed."""
+    if sys.platform != 'linux':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logging.getLogger("Server").info("Using uvloop event loop")
+
+
 def main():
     """Main function to run the server."""
     # Set up signal handler for graceful shutdown
@@ -28,6 +42,16 @@ def main():
             print(f"Invalid port number: {sys.argv[1]}")
             sys.exit(1)
     
+    # Configure logging once, for the whole process
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Prefer the libuv-based event loop when available; Server creates its
+    # loop through the installed policy
+    _install_uvloop()
+    
     # Create and start server
     server = Server(host='0.0.0.0', port=port)
     
@@ -2,22 +2,31 @@
 Server module - main server implementation.
 """
 
+import asyncio
+import itertools
 import socket
 import threading
 import logging
-import uuid
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, List
 from common.protocol import Protocol, MessageType
+from common.game import Game, GameState
 from common.player import Player
 from .client_handler import ClientHandler
 from .game_manager import GameManager
 
+# Player IDs: 8 hex digits from a counter seeded by the start time, so IDs
+# differ across restarts; only used from the event loop thread
+_id_counter = itertools.count(int(time.time()) & 0xFFFFFF)
+
 
 class Server:
     """
     Main Tic-Tac-Toe game server.
     
-    Manages client connections and game sessions.
+    Manages client connections and game sessions. All client I/O and
+    message handling runs on a single asyncio event loop, driven by a
+    background thread so that start() returns immediately.
     """
     
     def __init__(self, host: str = '0.0.0.0', port: int = 5555):
@@ -32,21 +41,29 @@ class Server:
         self.port = port
         self.server_socket: Optional[socket.socket] = None
         self.running = False
-        self.accept_thread: Optional[threading.Thread] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self._async_server: Optional[asyncio.AbstractServer] = None
         
-        # Client management
+        # Client management; only touched from the event loop thread, so
+        # no lock is needed (get_stats() from other threads only reads len())
         self.clients: Dict[str, ClientHandler] = {}
-        self.clients_lock = threading.Lock()
         
         # Game management
         self.game_manager = GameManager()
         
-        # Logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Logging (configured by the entry point)
         self.logger = logging.getLogger("Server")
+        
+        # Message dispatch table; every handler takes (player_id, data)
+        self._dispatch = {
+            MessageType.CREATE_GAME: self._handle_create_game,
+            MessageType.JOIN_GAME: self._handle_join_game,
+            MessageType.LIST_GAMES: self._handle_list_games,
+            MessageType.MAKE_MOVE: self._handle_make_move,
+            MessageType.QUIT_GAME: self._handle_quit_game,
+            MessageType.DISCONNECT: self._handle_disconnect_request,
+        }
     
     def start(self):
         """Start the server."""
@@ -55,81 +72,71 @@ class Server:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(5)
+            # Large backlog so bursts of connections queue instead of being refused
+            self.server_socket.listen(socket.SOMAXCONN)
+            
+            # Serve the listening socket from an event loop on its own thread
+            self.loop = asyncio.new_event_loop()
+            self._async_server = self.loop.run_until_complete(
+                self.loop.create_server(self._create_handler, sock=self.server_socket)
+            )
             
             self.running = True
-            self.logger.info(f"Server started on {self.host}:{self.port}")
+            self.logger.info("Server started on %s:%s", self.host, self.port)
             
-            # Start accepting connections
-            self.accept_thread = threading.Thread(target=self._accept_connections, daemon=True)
-            self.accept_thread.start()
+            self.loop_thread = threading.Thread(target=self._run_loop, daemon=True)
+            self.loop_thread.start()
             
             return True
         
         except Exception as e:
-            self.logger.error(f"Failed to start server: {e}")
+            self.logger.error("Failed to start server: %s", e)
             return False
     
-    def _accept_connections(self):
-        """Accept incoming client connections."""
-        while self.running:
-            try:
-                client_socket, client_address = self.server_socket.accept()
-                self.logger.info(f"New connection from {client_address}")
-                
-                # Create unique player ID
-                player_id = str(uuid.uuid4())[:8]
-                
-                # Create client handler
-                handler = ClientHandler(
-                    client_socket,
-                    client_address,
-                    player_id,
-                    self._handle_client_message
-                )
-                
-                with self.clients_lock:
-                    self.clients[player_id] = handler
-                
-                handler.start()
-            
-            except Exception as e:
-                if self.running:
-                    self.logger.error(f"Error accepting connection: {e}")
+    def _run_loop(self):
+        """Run the event loop until stop() is called."""
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
     
-    def _handle_client_message(self, player_id: str, message: Dict):
+    def _create_handler(self) -> ClientHandler:
+        """
+        Create the protocol instance for a newly accepted connection.
+        
+        Returns:
+            ClientHandler registered under a fresh player ID
+        """
+        # Create unique player ID
+        player_id = f"{next(_id_counter):08x}"
+        
+        # Create client handler
+        handler = ClientHandler(player_id, self._handle_client_message, self._handle_disconnect)
+        
+        self.clients[player_id] = handler
+        
+        self.logger.info("New connection for player %s", player_id)
+        return handler
+    
+    def _handle_client_message(self, player_id: str, msg_type: MessageType, msg_data: Dict):
         """
         Handle a message from a client.
         
         Args:
             player_id: ID of the client
-            message: Message dictionary
+            msg_type: Type of the message
+            msg_data: Message data
         """
-        msg_type = message.get('type')
-        msg_data = message.get('data', {})
+        handler = self._dispatch.get(msg_type)
+        if handler is None:
+            return
         
         try:
-            if msg_type == MessageType.CREATE_GAME.value:
-                self._handle_create_game(player_id, msg_data)
-            
-            elif msg_type == MessageType.JOIN_GAME.value:
-                self._handle_join_game(player_id, msg_data)
-            
-            elif msg_type == MessageType.LIST_GAMES.value:
-                self._handle_list_games(player_id)
-            
-            elif msg_type == MessageType.MAKE_MOVE.value:
-                self._handle_make_move(player_id, msg_data)
-            
-            elif msg_type == MessageType.QUIT_GAME.value:
-                self._handle_quit_game(player_id)
-            
-            elif msg_type == MessageType.DISCONNECT.value:
-                self._handle_disconnect(player_id)
-        
+            handler(player_id, msg_data)
         except Exception as e:
-            self.logger.error(f"Error handling message from {player_id}: {e}")
-            self._send_error(player_id, str(e))
+            self.logger.error("Error handling message from %s: %s", player_id, e)
+            self._send_error(player_id, str(e), cache=False)
     
     def _handle_create_game(self, player_id: str, data: Dict):
         """Handle CREATE_GAME request."""
@@ -153,7 +160,7 @@ class Server:
     def _handle_join_game(self, player_id: str, data: Dict):
         """Handle JOIN_GAME request."""
         game_id = data.get('game_id')
-        player_name = data.get('player_name', f'Player-{player_id[:4]}')
+        player_name = data.get('player_name', f'Player-{player_id[-4:]}')
         
         if not game_id:
             self._send_error(player_id, "Game ID required")
@@ -188,20 +195,18 @@ class Server:
             })
         
         # Notify all players in the game
-        self._broadcast_game_state(game_id)
-        self._broadcast_to_game(game_id, MessageType.PLAYER_JOINED, {
-            'player': player.to_dict()
-        })
+        self._broadcast_frames(game_id, [
+            game.state_frame(),
+            Protocol.encode_message(MessageType.PLAYER_JOINED, {
+                'player': player.to_dict()
+            })
+        ], game)
     
-    def _handle_list_games(self, player_id: str):
+    def _handle_list_games(self, player_id: str, data: Optional[Dict] = None):
         """Handle LIST_GAMES request."""
-        games = self.game_manager.list_available_games()
-        
         handler = self.clients.get(player_id)
         if handler:
-            handler.send_message(MessageType.GAME_LIST, {
-                'games': games
-            })
+            handler.send_frame(self.game_manager.game_list_frame())
     
     def _handle_make_move(self, player_id: str, data: Dict):
         """Handle MAKE_MOVE request."""
@@ -219,22 +224,25 @@ class Server:
             return
         
         # Broadcast updated game state to all players
-        self._broadcast_game_state(game.game_id)
+        frames = [game.state_frame()]
         
         # If game is finished, send game over message and clean up
-        if game.state.value == "FINISHED":
+        if game.state is GameState.FINISHED:
             game_over_data = {
                 'is_draw': game.is_draw
             }
             if game.winner:
                 game_over_data['winner'] = game.winner.to_dict()
             
-            self._broadcast_to_game(game.game_id, MessageType.GAME_OVER, game_over_data)
+            frames.append(Protocol.encode_message(MessageType.GAME_OVER, game_over_data))
+        
+        # Both frames go out to each player in a single write
+        self._broadcast_frames(game.game_id, frames, game)
             
             # Note: Player mappings are already cleaned up in game_manager.make_move()
             # when the game finishes, so players can join new games immediately
     
-    def _handle_quit_game(self, player_id: str):
+    def _handle_quit_game(self, player_id: str, data: Optional[Dict] = None):
         """Handle QUIT_GAME request."""
         game = self.game_manager.leave_game(player_id)
         
@@ -253,64 +261,70 @@ class Server:
             self._broadcast_game_state(game.game_id)
             
             # If game was in progress and now finished due to player leaving
-            if game.state.value == "FINISHED":
+            if game.state is GameState.FINISHED:
                 # Check if there's actually a winner or if game ended due to abandonment
                 active_players = game.get_active_player_count()
+                game_over_data = None
                 
                 if active_players == 0:
-                    # All players left - just end silently
-                    self.logger.info(f"All players left game {game.game_id}")
+                    # All players left - just end silently (the game was
+                    # already cleaned up by leave_game)
+                    self.logger.info("All players left game %s", game.game_id)
                 elif active_players == 1 and not game.winner:
                     # Only one player left and no winner - game abandoned
-                    self._broadcast_to_game(game.game_id, MessageType.GAME_OVER, {
+                    game_over_data = {
                         'is_draw': False,
                         'abandoned': True,
                         'reason': 'Other players left the game'
-                    })
-                    # Clean up player mappings
-                    for p in game.players:
-                        if p.player_id in self.game_manager.player_to_game:
-                            del self.game_manager.player_to_game[p.player_id]
+                    }
                 elif game.winner:
                     # There's an actual winner
-                    self._broadcast_to_game(game.game_id, MessageType.GAME_OVER, {
+                    game_over_data = {
                         'is_draw': False,
                         'winner': game.winner.to_dict()
-                    })
-                    # Clean up player mappings
-                    for p in game.players:
-                        if p.player_id in self.game_manager.player_to_game:
-                            del self.game_manager.player_to_game[p.player_id]
+                    }
+                
+                if game_over_data:
+                    self._broadcast_to_game(game.game_id, MessageType.GAME_OVER,
+                                            game_over_data, game)
+                    # Clean up player mappings in one pass
+                    self.game_manager.release_players(game)
+    
+    def _handle_disconnect_request(self, player_id: str, data: Optional[Dict] = None):
+        """Handle DISCONNECT request."""
+        # Closing the handler reports back through _handle_disconnect
+        handler = self.clients.get(player_id)
+        if handler:
+            handler.stop()
     
     def _handle_disconnect(self, player_id: str):
-        """Handle client disconnect."""
-        self.logger.info(f"Client {player_id} disconnecting")
+        """Handle client disconnect (called once by the stopping handler)."""
+        self.logger.info("Client %s disconnecting", player_id)
+        
+        # Remove the client handler first, so the departure broadcasts
+        # below only reach the remaining players
+        self.clients.pop(player_id, None)
         
         # Remove from game if in one
         self._handle_quit_game(player_id)
-        
-        # Remove client handler
-        with self.clients_lock:
-            if player_id in self.clients:
-                handler = self.clients[player_id]
-                handler.stop()
-                del self.clients[player_id]
     
-    def _broadcast_game_state(self, game_id: str):
+    def _broadcast_game_state(self, game_id: str, game: Optional[Game] = None):
         """
         Broadcast current game state to all players in a game.
         
         Args:
             game_id: Game to broadcast to
+            game: The game, if the caller already has it
         """
-        game = self.game_manager.get_game(game_id)
-        if not game:
-            return
+        if game is None:
+            game = self.game_manager.get_game(game_id)
+            if not game:
+                return
         
-        game_data = game.to_dict(include_board=True)
-        self._broadcast_to_game(game_id, MessageType.GAME_STATE, game_data)
+        self._broadcast_frames(game_id, [game.state_frame()], game)
     
-    def _broadcast_to_game(self, game_id: str, msg_type: MessageType, data: Dict):
+    def _broadcast_to_game(self, game_id: str, msg_type: MessageType, data: Dict,
+                           game: Optional[Game] = None):
         """
         Send a message to all players in a game.
         
@@ -318,41 +332,58 @@ class Server:
             game_id: Game ID
             msg_type: Message type
             data: Message data
+            game: The game, if the caller already has it
         """
-        game = self.game_manager.get_game(game_id)
-        if not game:
-            return
+        self._broadcast_frames(game_id, [Protocol.encode_message(msg_type, data)], game)
+    
+    def _broadcast_frames(self, game_id: str, frames: List[bytes], game: Optional[Game] = None):
+        """
+        Send encoded messages to all players in a game.
+        
+        Each message is encoded once by the caller, and each player
+        receives all of them in a single write.
         
-        with self.clients_lock:
-            for player in game.players:
-                handler = self.clients.get(player.player_id)
-                if handler:
-                    handler.send_message(msg_type, data)
+        Args:
+            game_id: Game ID
+            frames: Encoded messages, in send order
+            game: The game, if the caller already has it; otherwise it is
+                looked up, and nothing is sent if it no longer exists
+        """
+        if game is None:
+            game = self.game_manager.get_game(game_id)
+            if not game:
+                return
+        
+        # Each Player holds its ClientHandler (set on join), so no lookup in
+        # self.clients is needed; handlers of closed connections ignore sends
+        for player in game.players:
+            handler = player.socket
+            if handler:
+                handler.send_frames(frames)
     
-    def _send_error(self, player_id: str, error_message: str):
+    def _send_error(self, player_id: str, error_message: str, cache: bool = True):
         """
         Send an error message to a client.
         
         Args:
             player_id: Client ID
             error_message: Error message
+            cache: Whether the message is one of the fixed error strings
+                whose encoded frame can be reused
         """
         handler = self.clients.get(player_id)
         if handler:
-            handler.send_message(MessageType.ERROR, {
-                'message': error_message
-            })
+            handler.send_frame(Protocol.error_frame(error_message, cache))
     
     def stop(self):
         """Stop the server."""
         self.logger.info("Stopping server...")
         self.running = False
         
-        # Close all client connections
-        with self.clients_lock:
-            for handler in list(self.clients.values()):
-                handler.stop()
-            self.clients.clear()
+        # Close all client connections and the listener on the loop thread
+        if self.loop and self.loop_thread and self.loop_thread.is_alive():
+            self.loop.call_soon_threadsafe(self._shutdown_loop)
+            self.loop_thread.join(timeout=5)
         
         # Close server socket
         if self.server_socket:
@@ -363,6 +394,16 @@ class Server:
         
         self.logger.info("Server stopped")
     
+    def _shutdown_loop(self):
+        """Close every connection and stop the event loop (loop thread only)."""
+        clients, self.clients = self.clients, {}
+        for handler in clients.values():
+            handler.stop()
+        
+        if self._async_server:
+            self._async_server.close()
+        self.loop.stop()
+    
     def get_stats(self) -> Dict:
         """Get server statistics."""
         stats = self.game_manager.get_stats()